@@ -6,8 +6,10 @@ Dependency Injection Container for Desktop Client
 Provides consistent dependency management patterns matching the server architecture.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional, TypeVar, Type, Callable
+import functools
+from typing import Dict, Any, Optional, TypeVar, Type, Callable, Tuple, List
 from dataclasses import dataclass
 
 from shared.functional import Result, Success, Failure
@@ -16,6 +18,17 @@ logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Registry kind tags
+KIND_SINGLETON = 0
+KIND_SERVICE = 1
+KIND_FACTORY = 2
+
+
+@functools.lru_cache(maxsize=128)
+def _service_not_found(name: str) -> Result[Any, str]:
+    """Shared Failure for unknown service names"""
+    return Failure(f"Service not found: {name}")
+
 
 @dataclass
 class ClientConfig:
@@ -38,10 +51,17 @@ class ClientConfig:
     # UI configuration
     ui_show_notifications: bool = True
     ui_recording_feedback: bool = True
+    ui_history_max_entries: int = 10000
+    ui_poll_interval_ms: int = 10  # GUI event pump interval while busy
+    ui_poll_max_interval_ms: int = 50  # Backed-off interval while idle
     
     # Logging
     logging_level: str = "INFO"
     logging_file: Optional[str] = None
+    
+    # Service lifecycle: run consecutive async hooks concurrently (opt-in;
+    # only safe when those services don't depend on each other's init order)
+    services_parallel_lifecycle: bool = False
 
 
 class ClientContainer:
@@ -53,46 +73,54 @@ class ClientContainer:
     
     def __init__(self, config: ClientConfig):
         self.config = config
-        self._services: Dict[str, Any] = {}
-        self._factories: Dict[str, Callable[[], Any]] = {}
-        self._singletons: Dict[str, Any] = {}
+        # Single merged registry: name -> (kind tag, instance or factory, cached Success)
+        self._registry: Dict[str, Tuple[int, Any, Optional[Result[Any, str]]]] = {}
+        # Lifecycle hooks resolved at registration: service name -> hook is async
+        self._async_init: Dict[str, bool] = {}
+        self._async_cleanup: Dict[str, bool] = {}
         
         logger.info("Client container initialized")
     
     def register_singleton(self, name: str, instance: T) -> None:
         """Register a singleton instance"""
-        self._singletons[name] = instance
+        self._forget_hooks(name)
+        self._registry[name] = (KIND_SINGLETON, instance, Success(instance))
         logger.debug(f"Singleton registered: {name}")
     
     def register_factory(self, name: str, factory: Callable[[], T]) -> None:
         """Register a factory function"""
-        self._factories[name] = factory
+        self._forget_hooks(name)
+        self._registry[name] = (KIND_FACTORY, factory, None)
         logger.debug(f"Factory registered: {name}")
     
     def register_service(self, name: str, service: T) -> None:
         """Register a service instance"""
-        self._services[name] = service
+        self._forget_hooks(name)
+        self._registry[name] = (KIND_SERVICE, service, Success(service))
+        
+        initialize = getattr(service, 'initialize', None)
+        if callable(initialize):
+            self._async_init[name] = asyncio.iscoroutinefunction(initialize)
+        cleanup = getattr(service, 'cleanup', None)
+        if callable(cleanup):
+            self._async_cleanup[name] = asyncio.iscoroutinefunction(cleanup)
         logger.debug(f"Service registered: {name}")
     
     def get(self, name: str, service_type: Type[T] = None) -> Result[T, str]:
         """Get a service by name"""
-        # Check singletons first
-        if name in self._singletons:
-            return Success(self._singletons[name])
+        entry = self._registry.get(name)
+        if entry is None:
+            return _service_not_found(name)
         
-        # Check services
-        if name in self._services:
-            return Success(self._services[name])
+        # Instances resolve to the Success wrapper built at registration
+        kind, payload, cached = entry
+        if cached is not None:
+            return cached
         
-        # Check factories
-        if name in self._factories:
-            try:
-                instance = self._factories[name]()
-                return Success(instance)
-            except Exception as e:
-                return Failure(f"Factory failed for {name}: {e}")
-        
-        return Failure(f"Service not found: {name}")
+        try:
+            return Success(payload())
+        except Exception as e:
+            return Failure(f"Factory failed for {name}: {e}")
     
     def get_or_create(self, name: str, factory: Callable[[], T]) -> Result[T, str]:
         """Get service or create with factory if not found"""
@@ -107,22 +135,101 @@ class ClientContainer:
         except Exception as e:
             return Failure(f"Failed to create {name}: {e}")
     
+    def _forget_hooks(self, name: str) -> None:
+        """Drop cached lifecycle hooks for a name being re-registered"""
+        self._async_init.pop(name, None)
+        self._async_cleanup.pop(name, None)
+    
+    async def _run_hooks(self, hooks: Dict[str, bool], hook: str,
+                         stop_on_error: bool) -> List[Tuple[str, BaseException]]:
+        """
+        Invoke a lifecycle hook on every service that has one
+        
+        Hooks run in registration order. With parallel lifecycle enabled, each
+        run of consecutive async hooks is awaited concurrently; sync hooks still
+        wait for the async hooks registered before them. Returns (name, error)
+        pairs for failures, stopping at the first one when stop_on_error is set.
+        """
+        parallel = self.config.services_parallel_lifecycle
+        errors: List[Tuple[str, BaseException]] = []
+        batch: List[str] = []
+        
+        for name, is_async in list(hooks.items()):
+            if is_async and parallel:
+                batch.append(name)
+                continue
+            
+            if batch:
+                errors.extend(await self._run_hook_batch(batch, hook, stop_on_error))
+                batch = []
+                if errors and stop_on_error:
+                    return errors
+            
+            method = getattr(self._registry[name][1], hook)
+            try:
+                if is_async:
+                    await method()
+                else:
+                    method()
+                logger.debug(f"Service {hook} completed: {name}")
+            except Exception as e:
+                errors.append((name, e))
+                if stop_on_error:
+                    return errors
+        
+        if batch:
+            errors.extend(await self._run_hook_batch(batch, hook, stop_on_error))
+        
+        return errors
+    
+    async def _run_hook_batch(self, names: List[str], hook: str,
+                              stop_on_error: bool) -> List[Tuple[str, BaseException]]:
+        """
+        Await one run of async hooks concurrently
+        
+        With stop_on_error, hooks still running when one fails are cancelled.
+        A hook that cancels itself counts as a failure; other BaseExceptions
+        (KeyboardInterrupt, SystemExit) propagate.
+        """
+        tasks = [asyncio.ensure_future(getattr(self._registry[name][1], hook)()) for name in names]
+        return_when = asyncio.FIRST_EXCEPTION if stop_on_error else asyncio.ALL_COMPLETED
+        try:
+            _, pending = await asyncio.wait(tasks, return_when=return_when)
+        except asyncio.CancelledError:
+            for task in tasks:
+                task.cancel()
+            raise
+        
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+        
+        errors: List[Tuple[str, BaseException]] = []
+        for name, task in zip(names, tasks):
+            if task in pending:
+                continue  # Cancelled here after another hook failed
+            if task.cancelled():
+                errors.append((name, asyncio.CancelledError(f"{hook} cancelled")))
+                continue
+            error = task.exception()
+            if error is None:
+                logger.debug(f"Service {hook} completed: {name}")
+            elif isinstance(error, Exception):
+                errors.append((name, error))
+            else:
+                raise error
+        return errors
+    
     async def initialize_services(self) -> Result[None, str]:
         """Initialize all registered services"""
         logger.info("Initializing client services...")
         
-        # Initialize services that require async setup
-        for name, service in self._services.items():
-            if hasattr(service, 'initialize') and callable(service.initialize):
-                try:
-                    if asyncio.iscoroutinefunction(service.initialize):
-                        await service.initialize()
-                    else:
-                        service.initialize()
-                    logger.debug(f"Service initialized: {name}")
-                except Exception as e:
-                    logger.error(f"Failed to initialize {name}: {e}")
-                    return Failure(f"Service initialization failed: {name}")
+        errors = await self._run_hooks(self._async_init, 'initialize', stop_on_error=True)
+        for name, e in errors:
+            logger.error(f"Failed to initialize {name}: {e}")
+        if errors:
+            return Failure(f"Service initialization failed: {errors[0][0]}")
         
         logger.info("All services initialized successfully")
         return Success(None)
@@ -131,36 +238,29 @@ class ClientContainer:
         """Cleanup all services"""
         logger.info("Cleaning up client services...")
         
-        for name, service in self._services.items():
-            if hasattr(service, 'cleanup') and callable(service.cleanup):
-                try:
-                    if asyncio.iscoroutinefunction(service.cleanup):
-                        await service.cleanup()
-                    else:
-                        service.cleanup()
-                    logger.debug(f"Service cleaned up: {name}")
-                except Exception as e:
-                    logger.error(f"Failed to cleanup {name}: {e}")
+        errors = await self._run_hooks(self._async_cleanup, 'cleanup', stop_on_error=False)
+        for name, e in errors:
+            logger.error(f"Failed to cleanup {name}: {e}")
         
         logger.info("Service cleanup completed")
 
 
-# Global container instance
+# Global container instance (explicitly set via set_container)
 _container: Optional[ClientContainer] = None
 
 
+@functools.lru_cache(maxsize=1)
 def get_container() -> ClientContainer:
     """Get the global container instance"""
-    global _container
-    
-    if _container is None:
-        config = ClientConfig()
-        _container = ClientContainer(config)
+    if _container is not None:
+        return _container
     
-    return _container
+    config = ClientConfig()
+    return ClientContainer(config)
 
 
 def set_container(container: ClientContainer) -> None:
     """Set the global container instance"""
     global _container
-    _container = container
\ No newline at end of file
+    _container = container
+    get_container.cache_clear()
@@ -7,68 +7,57 @@ Event classes for GUI interactions and state changes.
 Extends the shared event system with GUI-specific functionality.
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any, Optional
+from typing import ClassVar, Dict, Any, Optional
 
-from shared.events import BaseEvent
+from shared.events import BaseEvent, event_dataclass
 
 
-@dataclass
+@event_dataclass
 class GUIShowEvent(BaseEvent):
     """Event fired when GUI window should be shown"""
     window_type: str = "main"  # main, settings, history
     
-    @property
-    def event_type(self) -> str:
-        return "gui.show"
+    event_type: ClassVar[str] = "gui.show"
 
 
-@dataclass  
+@event_dataclass
 class GUIHideEvent(BaseEvent):
     """Event fired when GUI window should be hidden"""
     window_type: str = "main"  # main, settings, history
     
-    @property
-    def event_type(self) -> str:
-        return "gui.hide"
+    event_type: ClassVar[str] = "gui.hide"
 
 
-@dataclass
+@event_dataclass
 class SettingsChangedEvent(BaseEvent):
     """Event fired when settings are modified through GUI"""
     changed_settings: Dict[str, Any] = None
     
+    event_type: ClassVar[str] = "settings.changed"
+    
     def __post_init__(self):
         if self.changed_settings is None:
             object.__setattr__(self, 'changed_settings', {})
-    
-    @property
-    def event_type(self) -> str:
-        return "settings.changed"
 
 
-@dataclass
+@event_dataclass
 class TranscriptionCopiedEvent(BaseEvent):
     """Event fired when transcription text is copied to clipboard"""
     text: str = ""
     transcription_id: Optional[str] = None
     
-    @property
-    def event_type(self) -> str:
-        return "transcription.copied"
+    event_type: ClassVar[str] = "transcription.copied"
 
 
-@dataclass
+@event_dataclass
 class GUIStateChangedEvent(BaseEvent):
     """Event fired when GUI state changes"""
     component: str = ""  # window, button, status
     new_state: str = ""  # visible, hidden, enabled, disabled
     details: Dict[str, Any] = None
     
+    event_type: ClassVar[str] = "gui.state_changed"
+    
     def __post_init__(self):
         if self.details is None:
-            object.__setattr__(self, 'details', {})
-    
-    @property  
-    def event_type(self) -> str:
-        return "gui.state_changed"
\ No newline at end of file
+            object.__setattr__(self, 'details', {})
\ No newline at end of file
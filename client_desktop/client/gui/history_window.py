@@ -8,11 +8,14 @@ GUI for viewing, managing, and exporting transcription history.
 
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
+import asyncio
 import logging
 import json
 import time
-from typing import List, Dict, Any, Optional
-from datetime import datetime
+from array import array
+from functools import lru_cache
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterable, Iterator
 
 from shared.functional import Result, Success, Failure
 from shared.events import EventBus
@@ -21,6 +24,28 @@ from .gui_events import TranscriptionCopiedEvent
 logger = logging.getLogger(__name__)
 
 
+def _json_dumps_row(row: Dict[str, Any]) -> bytes:
+    """Serialize one export row with the standard library encoder"""
+    return json.dumps(row, ensure_ascii=False).encode()
+
+
+# Faster C encoder for JSON export (optional)
+try:
+    import orjson
+    
+    def _dumps_row(row: Dict[str, Any]) -> bytes:
+        """Serialize one export row with orjson"""
+        return orjson.dumps(row, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _dumps_row = _json_dumps_row
+
+
+@lru_cache(maxsize=4)
+def _fmt_ts(second: int) -> str:
+    """Format a whole-second timestamp for display (memoized, adds cluster by second)"""
+    return time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(second))
+
+
 class HistoryWindow:
     """
     Transcription history viewer
@@ -33,50 +58,207 @@ class HistoryWindow:
     - Search/filter functionality
     """
     
-    def __init__(self, event_bus: EventBus):
+    # Default cap on stored transcriptions; the oldest are dropped beyond it
+    MAX_ENTRIES = 10_000
+    
+    # Extra fraction of the cap dropped per trim, so trims (and the rebuild
+    # they force) happen once per batch of adds rather than on every add
+    TRIM_SLACK = 0.1
+    
+    # Rows inserted into the tree view at a time (initial fill and each back-fill)
+    FILL_CHUNK_SIZE = 200
+    
+    # Scroll position (fraction of loaded rows) that triggers loading older rows
+    BACKFILL_THRESHOLD = 0.9
+    
+    # Tree view columns: (name, heading, width)
+    TREE_COLUMNS = (
+        ('datetime', 'Date & Time', 150),
+        ('preview', 'Preview', 300),
+    )
+    
+    # Fonts for the details pane
+    LABEL_FONT = ('Arial', 10, 'bold')
+    DETAILS_FONT = ('Arial', 10)
+    
+    # Characters of text shown in the tree view preview column
+    PREVIEW_LENGTH = 50
+    
+    # Delay before showing a selected row, coalescing fast arrow-key browsing
+    DETAILS_DEBOUNCE_MS = 30
+    
+    # Write buffer for history exports
+    EXPORT_BUFFER_SIZE = 1 << 20
+    
+    # How long non-blocking notifications stay on screen
+    TOAST_DURATION_MS = 1500
+    
+    # Toast (background, foreground) colours per level
+    TOAST_COLORS = {
+        'info': ('#323232', '#ffffff'),
+        'warning': ('#8a6d00', '#ffffff'),
+    }
+    
+    # Bindtag making the details pane read-only without toggling its state
+    READ_ONLY_BINDTAG = 'HistoryReadOnlyText'
+    
+    # Key sequences still handled by the read-only pane (navigation and copy)
+    READ_ONLY_PASSTHROUGH = ('<Control-c>', '<Control-a>', '<Left>', '<Right>', '<Up>',
+                             '<Down>', '<Prior>', '<Next>', '<Home>', '<End>')
+    
+    def __init__(self, event_bus: EventBus, max_entries: int = MAX_ENTRIES):
         self.event_bus = event_bus
+        self.max_entries = max(1, max_entries)
+        
+        # Loop that owns the event bus; captured when created inside it
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
         
         self.root: Optional[tk.Toplevel] = None
         self.parent_window: Optional[tk.Tk] = None
         
-        # History data
-        self.transcriptions: List[Dict[str, Any]] = []
+        # History data, stored column-wise (one entry per transcription in each)
+        self._texts: List[str] = []
+        self._timestamps = array('d')
+        self._datetimes: List[str] = []
+        self._metadata: List[Dict[str, Any]] = []
+        self._previews: List[str] = []
         
         # GUI components
         self.tree: Optional[ttk.Treeview] = None
         self.details_text: Optional[tk.Text] = None
         
+        # Lazy tree fill: newest index not yet inserted (-1 when all are shown)
+        self._next_unfilled = -1
+        self._backfill_after_id: Optional[str] = None
+        
+        # Newest index shown at the top of the tree; later adds are flushed on idle
+        self._newest_shown = -1
+        self._append_after_id: Optional[str] = None
+        
+        # Tree item id -> history index for every inserted row
+        self._iid_to_index: Dict[str, int] = {}
+        
+        # Bumped on every rebuild so stale back-fill callbacks are dropped
+        self._rebuild_generation = 0
+        
+        # Details pane state: index currently displayed and pending update
+        self._shown_index: Optional[int] = None
+        self._details_after_id: Optional[str] = None
+        
         logger.info("History window initialized")
     
     def add_transcription(self, text: str, metadata: Optional[Dict[str, Any]] = None) -> None:
         """Add a transcription to history"""
-        transcription = {
-            'text': text,
-            'timestamp': time.time(),
-            'datetime': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
-            'metadata': metadata or {}
-        }
+        timestamp = time.time()
+        self._append_entry(text, timestamp, _fmt_ts(int(timestamp)), metadata or {})
         
-        self.transcriptions.append(transcription)
-        
-        # Update tree view if window is open
-        if self.tree:
+        if len(self._texts) > self.max_entries:
+            self._drop_oldest(len(self._texts) - self.max_entries
+                              + int(self.max_entries * self.TRIM_SLACK))
+            # Indices (and so tree iids) shifted; rebuild, which also shows the new row
             self._refresh_tree_view()
+            return
+        
+        # Update tree view if window is open; a burst of adds is flushed in one idle pass
+        if self.tree and self._append_after_id is None:
+            self._append_after_id = self.root.after_idle(self._flush_new_rows)
+    
+    def set_history(self, entries: Iterable[Dict[str, Any]]) -> None:
+        """
+        Replace history with externally tracked transcription entries
+        
+        Entries are dicts with 'text' and 'timestamp' keys and an optional
+        'datetime' display string (derived from the timestamp when absent); an
+        explicit 'metadata' dict is kept as-is, otherwise any remaining keys
+        become the entry's metadata.
+        """
+        self._clear_entries()
+        for entry in entries:
+            metadata = entry.get('metadata')
+            if metadata is None:
+                metadata = {k: v for k, v in entry.items()
+                            if k not in ('text', 'timestamp', 'datetime')}
+            # Recordings awaiting transcription carry text=None
+            timestamp = entry['timestamp']
+            datetime_str = entry.get('datetime') or _fmt_ts(int(timestamp))
+            self._append_entry(entry['text'] or '', timestamp, datetime_str, metadata)
+        
+        if len(self._texts) > self.max_entries:
+            self._drop_oldest(len(self._texts) - self.max_entries)
+        
+        self._refresh_tree_view()
+    
+    def _append_entry(self, text: str, timestamp: float, datetime_str: str,
+                      metadata: Dict[str, Any]) -> None:
+        """Append one transcription across all history columns"""
+        self._texts.append(text)
+        self._timestamps.append(timestamp)
+        self._datetimes.append(datetime_str)
+        self._metadata.append(metadata)
+        self._previews.append(
+            text[:self.PREVIEW_LENGTH] + ('…' if len(text) > self.PREVIEW_LENGTH else '')
+        )
+    
+    def _clear_entries(self) -> None:
+        """Drop all transcriptions from every history column"""
+        self._texts.clear()
+        del self._timestamps[:]
+        self._datetimes.clear()
+        self._metadata.clear()
+        self._previews.clear()
+        self._shown_index = None
+        self._cancel_pending_details()
+    
+    def _drop_oldest(self, count: int) -> None:
+        """Remove the count oldest transcriptions from every history column"""
+        del self._texts[:count]
+        del self._timestamps[:count]
+        del self._datetimes[:count]
+        del self._metadata[:count]
+        del self._previews[:count]
+        
+        # Keep the details pane pointing at the same entry, if it survived
+        if self._shown_index is not None:
+            self._shown_index = self._shown_index - count if self._shown_index >= count else None
+        self._cancel_pending_details()
+    
+    def _cancel_pending_details(self) -> None:
+        """Drop a debounced details update; its index may no longer name the same entry"""
+        if self._details_after_id is not None:
+            if self.root is not None:
+                self.root.after_cancel(self._details_after_id)
+            self._details_after_id = None
+    
+    def _iter_rows(self) -> Iterator[Dict[str, Any]]:
+        """Yield transcriptions as export dicts, oldest first"""
+        for text, timestamp, datetime_str, metadata in zip(
+                self._texts, self._timestamps, self._datetimes, self._metadata):
+            yield {
+                'text': text,
+                'timestamp': timestamp,
+                'datetime': datetime_str,
+                'metadata': metadata
+            }
     
     def show(self, parent_window: tk.Tk) -> Result[None, Exception]:
         """Show the history window"""
         try:
             self.parent_window = parent_window
             
+            # The Toplevel is built once and reused across show/hide cycles;
+            # afterwards appends and set_history keep its rows current
             if self.root is None:
                 self._create_window()
+                self._refresh_tree_view()
             
             self.root.deiconify()
+            self.root.grab_set()
             self.root.lift()
             self.root.focus()
             
-            self._refresh_tree_view()
-            
             logger.info("History window shown")
             return Success(None)
         except Exception as e:
@@ -87,6 +269,7 @@ class HistoryWindow:
         """Hide the history window"""
         try:
             if self.root:
+                self.root.grab_release()  # Release modal grab while withdrawn
                 self.root.withdraw()
             logger.info("History window hidden")
             return Success(None)
@@ -100,9 +283,11 @@ class HistoryWindow:
         self.root.title("Transcription History")
         self.root.geometry("700x500")
         
-        # Make modal
+        # Make modal (grab is taken in show() and released in hide())
         self.root.transient(self.parent_window)
-        self.root.grab_set()
+        
+        # Closing the window only hides it so it can be shown again cheaply
+        self.root.protocol("WM_DELETE_WINDOW", self.hide)
         
         self._create_widgets()
         self._setup_layout()
@@ -131,18 +316,17 @@ class HistoryWindow:
         tree_frame = ttk.Frame(parent_frame)
         
         # Configure tree view columns
-        columns = ('datetime', 'preview')
+        columns = tuple(name for name, _, _ in self.TREE_COLUMNS)
         tree = ttk.Treeview(tree_frame, columns=columns, show='headings', height=15)
         
         # Set column headers and properties
-        tree.heading('datetime', text='Date & Time')
-        tree.heading('preview', text='Preview')
-        tree.column('datetime', width=150, anchor='w')
-        tree.column('preview', width=300, anchor='w')
+        for name, heading, width in self.TREE_COLUMNS:
+            tree.heading(name, text=heading)
+            tree.column(name, width=width, anchor='w')
         
         # Add scrollbar for tree
         tree_scrollbar = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL, command=tree.yview)
-        tree.configure(yscrollcommand=tree_scrollbar.set)
+        tree.configure(yscrollcommand=self._on_tree_scroll)
         
         # Bind selection event
         tree.bind('<<TreeviewSelect>>', self._on_tree_select)
@@ -155,11 +339,12 @@ class HistoryWindow:
     
     def _create_details_widgets(self, parent_frame) -> Dict[str, Any]:
         """Pure function to create details display widgets"""
-        details_label = ttk.Label(parent_frame, text="Full Text:", font=('Arial', 10, 'bold'))
+        details_label = ttk.Label(parent_frame, text="Full Text:", font=self.LABEL_FONT)
         
         details_frame = ttk.Frame(parent_frame)
-        details_text = tk.Text(details_frame, wrap=tk.WORD, state=tk.DISABLED,
-                             font=('Arial', 10), height=20)
+        details_text = tk.Text(details_frame, wrap=tk.WORD,
+                             font=self.DETAILS_FONT, height=20)
+        self._make_read_only(details_text)
         details_scrollbar = ttk.Scrollbar(details_frame, orient=tk.VERTICAL,
                                         command=details_text.yview)
         details_text.configure(yscrollcommand=details_scrollbar.set)
@@ -171,6 +356,36 @@ class HistoryWindow:
             'details_scrollbar': details_scrollbar
         }
     
+    def _make_read_only(self, text_widget: tk.Text) -> None:
+        """Block edits on a Text widget through a leading bindtag"""
+        tag = self.READ_ONLY_BINDTAG
+        
+        # 'break' stops the Text class bindings from inserting or deleting
+        text_widget.bind_class(tag, '<Key>', lambda e: 'break')
+        for sequence in ('<<Cut>>', '<<Paste>>', '<<PasteSelection>>', '<Button-2>'):
+            text_widget.bind_class(tag, sequence, lambda e: 'break')
+        
+        # More specific bindings that fall through to the Text class, plus
+        # whatever this platform maps to copy
+        for sequence in (*self.READ_ONLY_PASSTHROUGH, *text_widget.event_info('<<Copy>>')):
+            text_widget.bind_class(tag, sequence, lambda e: None)
+        
+        # The Text class would insert a tab; traverse focus like other widgets instead
+        text_widget.bind_class(tag, '<Tab>',
+                               lambda e: self._traverse_focus(e.widget.tk_focusNext()))
+        for sequence in text_widget.event_info('<<PrevWindow>>'):
+            text_widget.bind_class(tag, sequence,
+                                   lambda e: self._traverse_focus(e.widget.tk_focusPrev()))
+        
+        text_widget.bindtags((tag,) + text_widget.bindtags())
+    
+    @staticmethod
+    def _traverse_focus(widget) -> str:
+        """Move keyboard focus to widget, if any, and stop further bindings"""
+        if widget is not None:
+            widget.focus_set()
+        return 'break'
+    
     def _create_action_button_widgets(self) -> Dict[str, Any]:
         """Pure function to create action button widgets"""
         button_frame = ttk.Frame(self.root)
@@ -247,20 +462,79 @@ class HistoryWindow:
         self.copy_button.pack(side=tk.RIGHT, padx=5)
     
     def _refresh_tree_view(self) -> None:
-        """Refresh the tree view with current transcriptions"""
+        """
+        Rebuild the tree view from current transcriptions
+        
+        Only needed when history is replaced or cleared; appends go through
+        _flush_new_rows so existing rows are left untouched. Only the newest
+        chunk is inserted up front; older rows are back-filled as the user
+        scrolls towards the bottom.
+        """
         if not self.tree:
             return
         
-        # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self._rebuild_generation += 1
+        
+        # Clear existing items in a single Tcl call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
+        self._iid_to_index.clear()
         
         # Add transcriptions in reverse order (newest first)
-        for i, transcription in enumerate(reversed(self.transcriptions)):
-            preview = transcription['text'][:50] + ('...' if len(transcription['text']) > 50 else '')
-            
-            self.tree.insert('', tk.END, iid=str(len(self.transcriptions) - 1 - i),
-                           values=(transcription['datetime'], preview))
+        self._next_unfilled = self._newest_shown = len(self._texts) - 1
+        self._backfill_after_id = None
+        self._fill_tree_rows()
+    
+    def _fill_tree_rows(self) -> None:
+        """Insert the next chunk of older rows below those already shown"""
+        start = self._next_unfilled
+        stop = max(start - self.FILL_CHUNK_SIZE, -1)
+        
+        # Call the Tcl command directly, skipping ttk's per-row option conversion
+        call, path = self.tree.tk.call, self.tree._w
+        datetimes, previews, iids = self._datetimes, self._previews, self._iid_to_index
+        for index in range(start, stop, -1):
+            iid = str(index)
+            iids[iid] = index
+            call(path, 'insert', '', 'end', '-id', iid, '-values', (datetimes[index], previews[index]))
+        
+        self._next_unfilled = stop
+    
+    def _on_tree_scroll(self, first: str, last: str) -> None:
+        """Forward tree scrolling to the scrollbar and back-fill near the bottom"""
+        self.tree_scrollbar.set(first, last)
+        
+        if (self._next_unfilled >= 0 and self._backfill_after_id is None
+                and float(last) >= self.BACKFILL_THRESHOLD):
+            # Defer: inserting from inside yscrollcommand would re-enter it
+            self._backfill_after_id = self.root.after_idle(self._backfill, self._rebuild_generation)
+    
+    def _backfill(self, generation: int) -> None:
+        """Idle callback loading one more chunk of older rows"""
+        if generation != self._rebuild_generation or not self.tree:
+            return
+        
+        self._backfill_after_id = None
+        if self._next_unfilled >= 0:
+            self._fill_tree_rows()
+    
+    def _flush_new_rows(self) -> None:
+        """Idle callback inserting rows added since the last flush at the top"""
+        self._append_after_id = None
+        if not self.tree:
+            return
+        
+        # History is append-only between rebuilds, so the list index is a stable iid;
+        # inserting oldest first at position 0 leaves the newest row on top
+        call, path = self.tree.tk.call, self.tree._w
+        datetimes, previews, iids = self._datetimes, self._previews, self._iid_to_index
+        for index in range(self._newest_shown + 1, len(self._texts)):
+            iid = str(index)
+            iids[iid] = index
+            call(path, 'insert', '', 0, '-id', iid, '-values', (datetimes[index], previews[index]))
+        
+        self._newest_shown = len(self._texts) - 1
     
     def _on_tree_select(self, event) -> None:
         """Handle tree selection"""
@@ -269,54 +543,75 @@ class HistoryWindow:
             return
         
         # Get selected transcription
-        item_id = selection[0]
-        index = int(item_id)
+        index = self._iid_to_index[selection[0]]
         
-        if 0 <= index < len(self.transcriptions):
-            transcription = self.transcriptions[index]
-            
-            # Update details text
-            self.details_text.config(state=tk.NORMAL)
-            self.details_text.delete('1.0', tk.END)
-            self.details_text.insert('1.0', transcription['text'])
-            self.details_text.config(state=tk.DISABLED)
+        # Supersede any pending update from an earlier selection
+        self._cancel_pending_details()
+        
+        if index == self._shown_index:
+            return
+        
+        self._details_after_id = self.root.after(self.DETAILS_DEBOUNCE_MS,
+                                                 self._show_details, index)
+    
+    def _show_details(self, index: int) -> None:
+        """Display the full text of a transcription in the details pane"""
+        self._details_after_id = None
+        if self.details_text is None:
+            return  # Window destroyed while the update was pending
+        
+        # History may have been cleared or trimmed since the selection was made
+        try:
+            text = self._texts[index]
+        except IndexError:
+            return
+        self._shown_index = index
+        
+        # Swap in the text with one Tcl call (kept read-only by its bindtag)
+        self.details_text.replace('1.0', tk.END, text)
     
     def _copy_selected(self) -> None:
         """Copy selected transcription to clipboard"""
         selection = self.tree.selection()
         if not selection:
-            messagebox.showwarning("No Selection", "Please select a transcription to copy.")
+            self._toast("Please select a transcription to copy.", 'warning')
             return
         
-        # Get selected transcription
+        # Get selected transcription (every tree row maps to a live entry)
         item_id = selection[0]
-        index = int(item_id)
+        text = self._texts[self._iid_to_index[item_id]]
         
-        if 0 <= index < len(self.transcriptions):
-            transcription = self.transcriptions[index]
-            text = transcription['text']
-            
-            # Copy to clipboard
-            self.root.clipboard_clear()
-            self.root.clipboard_append(text)
-            
-            # Publish copy event
-            event = TranscriptionCopiedEvent(
-                text=text,
-                transcription_id=str(index),
-                source="history_window"
-            )
-            import asyncio
-            # Use call_soon_threadsafe to schedule the coroutine
-            loop = asyncio.get_event_loop()
-            loop.call_soon_threadsafe(lambda: asyncio.create_task(self.event_bus.publish(event)))
-            
-            messagebox.showinfo("Copied", "Transcription copied to clipboard!")
+        # Copy to clipboard once the click has been handled; large texts take a while
+        self.root.after_idle(self._set_clipboard, text)
+        
+        # Publish copy event
+        event = TranscriptionCopiedEvent(
+            text=text,
+            transcription_id=item_id,
+            source="history_window"
+        )
+        self._publish_event(event)
+    
+    def _set_clipboard(self, text: str) -> None:
+        """Idle callback placing text on the clipboard"""
+        if not self.root:
+            return
+        
+        self.root.clipboard_clear()
+        self.root.clipboard_append(text)
+        
+        self._toast("Transcription copied to clipboard!")
+    
+    def _publish_event(self, event) -> None:
+        """Schedule an event bus publish on the owning event loop"""
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._loop.call_soon_threadsafe(self.event_bus.publish_nowait, event)
     
     def _export_history(self) -> None:
         """Export all transcriptions to file"""
-        if not self.transcriptions:
-            messagebox.showwarning("No Data", "No transcriptions to export.")
+        if not self._texts:
+            self._toast("No transcriptions to export.", 'warning')
             return
         
         # Get export file path
@@ -333,28 +628,37 @@ class HistoryWindow:
         if not file_path:
             return
         
+        # Pick the writer by file suffix; anything unrecognised is exported as text
+        exporters = {'.json': self._export_json, '.txt': self._export_text}
+        
         try:
-            if file_path.endswith('.json'):
-                # Export as JSON
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    json.dump(self.transcriptions, f, indent=2, ensure_ascii=False)
-            else:
-                # Export as text
-                with open(file_path, 'w', encoding='utf-8') as f:
-                    for transcription in self.transcriptions:
-                        f.write(f"[{transcription['datetime']}]\n")
-                        f.write(f"{transcription['text']}\n\n")
-            
-            messagebox.showinfo("Export Complete", f"History exported to {file_path}")
+            exporters.get(Path(file_path).suffix.lower(), self._export_text)(file_path)
+            self._toast(f"History exported to {file_path}")
             
         except Exception as e:
             logger.error(f"Failed to export history: {e}")
             messagebox.showerror("Export Failed", f"Failed to export history: {e}")
     
+    def _export_json(self, file_path: str) -> None:
+        """Write history as a JSON array, streamed one compact row per line"""
+        with open(file_path, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+            f.write(b'[\n')
+            for i, row in enumerate(self._iter_rows()):
+                if i:
+                    f.write(b',\n')
+                f.write(_dumps_row(row))
+            f.write(b'\n]\n')
+    
+    def _export_text(self, file_path: str) -> None:
+        """Write history as plain text, one pre-encoded block per entry"""
+        with open(file_path, 'wb', buffering=self.EXPORT_BUFFER_SIZE) as f:
+            f.writelines(f"[{datetime_str}]\n{text}\n\n".encode()
+                         for datetime_str, text in zip(self._datetimes, self._texts))
+    
     def _clear_history(self) -> None:
         """Clear all transcription history"""
-        if not self.transcriptions:
-            messagebox.showinfo("No Data", "History is already empty.")
+        if not self._texts:
+            self._toast("History is already empty.")
             return
         
         # Confirm clear
@@ -364,23 +668,50 @@ class HistoryWindow:
         )
         
         if result:
-            self.transcriptions.clear()
+            self._clear_entries()
             self._refresh_tree_view()
             
             # Clear details text
-            self.details_text.config(state=tk.NORMAL)
             self.details_text.delete('1.0', tk.END)
-            self.details_text.config(state=tk.DISABLED)
             
-            messagebox.showinfo("Cleared", "Transcription history cleared.")
+            self._toast("Transcription history cleared.")
+    
+    def _toast(self, message: str, level: str = 'info') -> None:
+        """Show a self-dismissing notification in the window's bottom-right corner"""
+        background, foreground = self.TOAST_COLORS.get(level, self.TOAST_COLORS['info'])
+        
+        toast = tk.Toplevel(self.root)
+        toast.overrideredirect(True)
+        tk.Label(toast, text=message, bg=background, fg=foreground,
+                 padx=12, pady=6).pack()
+        
+        toast.update_idletasks()
+        x = self.root.winfo_rootx() + self.root.winfo_width() - toast.winfo_reqwidth() - 20
+        y = self.root.winfo_rooty() + self.root.winfo_height() - toast.winfo_reqheight() - 20
+        toast.geometry(f"+{x}+{y}")
+        
+        toast.after(self.TOAST_DURATION_MS, toast.destroy)
     
     def get_history_count(self) -> int:
         """Get number of transcriptions in history"""
-        return len(self.transcriptions)
+        return len(self._texts)
     
     def destroy(self) -> None:
-        """Destroy the history window"""
+        """Destroy the history window; a later show() builds a fresh one"""
         if self.root:
+            # Pending after/after_idle callbacks outlive the Toplevel; drop them with it
+            self._cancel_pending_details()
+            for after_id in (self._append_after_id, self._backfill_after_id):
+                if after_id is not None:
+                    self.root.after_cancel(after_id)
             self.root.destroy()
             self.root = None
+            self.tree = None
+            self.details_text = None
+        
+        # Forget view state that described the destroyed widgets
+        self._append_after_id = self._backfill_after_id = None
+        self._shown_index = None
+        self._iid_to_index.clear()
+        self._next_unfilled = self._newest_shown = -1
         logger.info("History window destroyed")
\ No newline at end of file
@@ -11,22 +11,46 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import asyncio
 import logging
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple, Deque
+from collections import deque
+from functools import lru_cache
 from threading import Thread
-import queue
+import shutil
 import time
 import uuid
 
+# System clipboard support (optional)
+try:
+    import pyperclip
+except ImportError:
+    pyperclip = None
+
 from shared.functional import Result, Success, Failure
 from shared.events import (
     EventBus, ConnectionStatusEvent, TranscriptionReceivedEvent,
-    RecordingStartedEvent, RecordingStoppedEvent, ErrorEvent, AudioCapturedEvent
+    RecordingStartedEvent, RecordingStoppedEvent, ErrorEvent, AudioCapturedEvent,
+    HotkeyPressedEvent
 )
 from .gui_events import TranscriptionCopiedEvent, SettingsChangedEvent
+from .history_window import HistoryWindow
+from .settings_window import SettingsWindow
 from client.storage import get_recording_storage, cleanup_recording_storage
 
 logger = logging.getLogger(__name__)
 
+# Widget options set on every state change, bound once instead of per call
+_NORMAL = tk.NORMAL
+_DISABLED = tk.DISABLED
+_SUNKEN = tk.SUNKEN
+_FLAT = tk.FLAT
+_RAISED = tk.RAISED
+
+# Modifier names capitalized in hotkey display strings
+_DISPLAY_MODIFIERS = frozenset(('ctrl', 'shift', 'alt', 'cmd'))
+
+# Failure value for an empty selection; a sentinel so no error text can collide with it
+_NO_SELECTION = object()
+
 
 class MainWindow:
     """
@@ -41,6 +65,9 @@ class MainWindow:
     - Compact, always-on-top design
     """
     
+    # Window for collecting transcriptions into one history view update
+    TRANSCRIPTION_FLUSH_MS = 50
+    
     def __init__(self, event_bus: EventBus, config: Dict[str, Any], settings_manager=None):
         self.event_bus = event_bus
         self.config = config
@@ -48,15 +75,47 @@ class MainWindow:
         self.root: Optional[tk.Tk] = None
         self.is_running = False
 
-        # GUI update queue for thread safety
-        self.gui_queue = queue.Queue()
+        # Loop that owns the event bus; captured in initialize()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+        # Probed once: xclip mirrors copies into the X primary selection
+        self._has_xclip = shutil.which('xclip') is not None
 
         # State tracking
         self.connection_status = "disconnected"
         self.recording_state = "ready"  # ready, recording, processing
         self.last_transcription = ""
-        self.transcription_history = []  # Now includes: text, timestamp, datetime, recording_id, status
+        # Text served to other apps that request the PRIMARY selection
+        self._primary_selection_text = ""
+        # Newest first, matching row order; entries hold text, timestamp,
+        # datetime, recording_id, status. Oldest entries drop off past the cap.
+        self.transcription_history: Deque[Dict[str, Any]] = deque(
+            maxlen=max(1, int(config.get('ui_history_max_entries', 10000)))
+        )
         self.current_recording_id: Optional[str] = None  # Track current recording
+        # Hotkey from settings, loaded on first use and kept current on changes
+        self._current_hotkey: Optional[str] = None
+        # Hotkey last passed through _setup_gui_hotkeys
+        self._bound_hotkey: Optional[str] = None
+        # Status last drawn on the widgets; None until the first update
+        self._shown_connection_status: Optional[str] = None
+
+        # States last set on the copy and transcribe buttons (both created disabled)
+        self._selection_button_states: Tuple[str, str] = (_DISABLED, _DISABLED)
+
+        # Options last sent to the record button, so only changes are reconfigured
+        self._record_button_options: Dict[str, Any] = {}
+
+        # Latest-wins GUI updates awaiting idle, keyed by kind
+        self._latest_updates: Dict[str, Tuple[Callable, Tuple[Any, ...]]] = {}
+
+        # History view bookkeeping: rows shown and the next unique row iid
+        self._history_row_count = 0
+        self._next_history_iid = 0
+
+        # Transcriptions awaiting the next batched flush: (text, recording_id)
+        self._pending_transcriptions: List[Tuple[str, Optional[str]]] = []
+        self._transcription_flush_scheduled = False
 
         # Recording storage
         self.recording_storage = get_recording_storage()
@@ -68,19 +127,29 @@ class MainWindow:
         self.transcribe_button: Optional[tk.Button] = None
         self.transcription_text: Optional[tk.Text] = None
         self.copy_button: Optional[tk.Button] = None
-        self._active_menu: Optional[tk.Menu] = None
+        self._hamburger_menu: Optional[tk.Menu] = None  # Hamburger menu, built on first use
+        self._topmost_menu_index: Optional[int] = None  # Its always-on-top entry, recorded when built
+
+        # Companion windows, attached by the application after construction
+        self.history_window: Optional[HistoryWindow] = None
+        self.settings_window: Optional[SettingsWindow] = None
 
         logger.info("Main GUI window initialized")
     
     def initialize(self) -> Result[None, Exception]:
         """Initialize the GUI window and subscribe to events"""
         try:
+            try:
+                self._loop = asyncio.get_running_loop()
+            except RuntimeError:
+                pass  # Not called from the loop; resolved on first publish
+
             # Create the window immediately during initialization
             self._create_window()
             self._subscribe_to_events()
             return Success(None)
         except Exception as e:
-            logger.error(f"Failed to initialize main window: {e}")
+            logger.error("Failed to initialize main window: %s", e)
             return Failure(e)
     
     def _subscribe_to_events(self) -> None:
@@ -91,31 +160,33 @@ class MainWindow:
         self.event_bus.subscribe("recording.stopped", self._handle_recording_stopped)
         self.event_bus.subscribe("audio.captured", self._handle_audio_captured)
         self.event_bus.subscribe("error", self._handle_error)
+        self.event_bus.subscribe("settings.changed", self._handle_settings_changed)
 
         logger.info("GUI event subscriptions configured")
     
-    def _handle_connection_status(self, event: ConnectionStatusEvent) -> Result[None, Exception]:
+    def _handle_connection_status(self, event: ConnectionStatusEvent) -> None:
         """Handle connection status changes"""
-        self._queue_gui_update(lambda: self._update_connection_status(event.status))
-        return Success(None)
+        self._queue_latest_gui_update('connection', self._update_connection_status, event.status)
     
-    def _handle_transcription_received(self, event: TranscriptionReceivedEvent) -> Result[None, Exception]:
+    def _handle_transcription_received(self, event: TranscriptionReceivedEvent) -> None:
         """Handle new transcription results"""
-        self._queue_gui_update(lambda: self._update_transcription(event.text))
-        return Success(None)
+        # Bind the recording now; a new one may start before the batch is flushed
+        self._pending_transcriptions.append((event.text, self.current_recording_id))
+        if not self._transcription_flush_scheduled and self.root:
+            self._transcription_flush_scheduled = True
+            self.root.after(self.TRANSCRIPTION_FLUSH_MS, self._flush_transcriptions)
     
-    def _handle_recording_started(self, event: RecordingStartedEvent) -> Result[None, Exception]:
+    def _handle_recording_started(self, event: RecordingStartedEvent) -> None:
         """Handle recording started"""
-        logger.debug(f"GUI received RecordingStartedEvent: {event}")
+        logger.debug("GUI received RecordingStartedEvent: %s", event)
         # Generate new recording ID for this recording
         self.current_recording_id = str(uuid.uuid4())
-        logger.info(f"Started recording with ID: {self.current_recording_id}")
-        self._queue_gui_update(lambda: self._update_recording_state("recording"))
-        return Success(None)
+        logger.info("Started recording with ID: %s", self.current_recording_id)
+        self._queue_latest_gui_update('recording', self._update_recording_state, "recording")
 
-    def _handle_audio_captured(self, event: AudioCapturedEvent) -> Result[None, Exception]:
+    def _handle_audio_captured(self, event: AudioCapturedEvent) -> None:
         """Handle audio captured - save recording to disk"""
-        logger.debug(f"GUI received AudioCapturedEvent")
+        logger.debug("GUI received AudioCapturedEvent")
         if self.current_recording_id:
             # Save recording to disk
             save_result = self.recording_storage.save_recording(
@@ -125,29 +196,51 @@ class MainWindow:
                 audio_format=event.format
             )
             if save_result.is_success():
-                logger.info(f"Saved recording {self.current_recording_id} to disk")
+                logger.info("Saved recording %s to disk", self.current_recording_id)
             else:
-                logger.error(f"Failed to save recording: {save_result.error}")
-        return Success(None)
+                logger.error("Failed to save recording: %s", save_result.error)
 
-    def _handle_recording_stopped(self, event: RecordingStoppedEvent) -> Result[None, Exception]:
+    def _handle_recording_stopped(self, event: RecordingStoppedEvent) -> None:
         """Handle recording stopped - add 'Recorded (not transcribed)' entry"""
-        logger.debug(f"GUI received RecordingStoppedEvent: {event}")
+        logger.debug("GUI received RecordingStoppedEvent: %s", event)
         # Add entry with recording ID and "not transcribed" status
         if self.current_recording_id:
-            self._queue_gui_update(lambda: self._add_recorded_entry(self.current_recording_id))
-        self._queue_gui_update(lambda: self._update_recording_state("processing"))
-        return Success(None)
+            self._queue_gui_update(self._add_recorded_entry, self.current_recording_id)
+        self._queue_latest_gui_update('recording', self._update_recording_state, "processing")
     
-    def _handle_error(self, event: ErrorEvent) -> Result[None, Exception]:
+    def _handle_error(self, event: ErrorEvent) -> None:
         """Handle error events"""
-        self._queue_gui_update(lambda: self._show_error(event.error_message))
-        return Success(None)
+        self._queue_gui_update(self._show_error, event.error_message)
+
+    def _handle_settings_changed(self, event: SettingsChangedEvent) -> None:
+        """Keep the cached hotkey in step with saved settings"""
+        hotkey = event.changed_settings.get('hotkey')
+        if hotkey:
+            self._current_hotkey = hotkey
     
-    def _queue_gui_update(self, update_func: Callable) -> None:
-        """Queue a GUI update for thread-safe execution"""
-        logger.debug("Queuing GUI update")
-        self.gui_queue.put(update_func)
+    def _queue_gui_update(self, update_func: Callable, *args: Any) -> None:
+        """Schedule update_func(*args) to run when Tk is next idle"""
+        if self.root:
+            try:
+                self.root.after_idle(update_func, *args)
+            except tk.TclError:
+                pass  # Event arrived while the window was being destroyed
+
+    def _queue_latest_gui_update(self, key: str, update_func: Callable, *args: Any) -> None:
+        """Like _queue_gui_update, but a newer update with the same key replaces a pending one"""
+        if key not in self._latest_updates:
+            if not self.root:
+                return
+            try:
+                self.root.after_idle(self._run_latest_update, key)
+            except tk.TclError:
+                return  # Event arrived while the window was being destroyed
+        self._latest_updates[key] = (update_func, args)
+
+    def _run_latest_update(self, key: str) -> None:
+        """Run the most recent update queued under key"""
+        update_func, args = self._latest_updates.pop(key)
+        update_func(*args)
     
     def show(self) -> Result[None, Exception]:
         """Show the main window"""
@@ -159,13 +252,10 @@ class MainWindow:
             self.root.lift()
             self.is_running = True
             
-            # Start GUI update processing
-            self._process_gui_updates()
-            
             logger.info("Main window shown")
             return Success(None)
         except Exception as e:
-            logger.error(f"Failed to show main window: {e}")
+            logger.error("Failed to show main window: %s", e)
             return Failure(e)
     
     def hide(self) -> Result[None, Exception]:
@@ -177,7 +267,7 @@ class MainWindow:
             logger.info("Main window hidden")
             return Success(None)
         except Exception as e:
-            logger.error(f"Failed to hide main window: {e}")
+            logger.error("Failed to hide main window: %s", e)
             return Failure(e)
     
     def _create_window(self) -> None:
@@ -195,6 +285,9 @@ class MainWindow:
         
         # Configure window close behavior
         self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
+
+        # Serve PRIMARY from one handler; copies just swap the text and re-own
+        self.root.selection_handle(self._serve_primary_selection)
         
         self._create_widgets()
         self._setup_layout()
@@ -210,8 +303,8 @@ class MainWindow:
 
         # Store widget references
         self.transcription_frame = transcription_widgets['transcription_frame']
-        self.history_listbox_frame = transcription_widgets['history_listbox_frame']
-        self.history_listbox = transcription_widgets['history_listbox']
+        self.history_tree_frame = transcription_widgets['history_tree_frame']
+        self.history_tree = transcription_widgets['history_tree']
         self.history_scrollbar = transcription_widgets['history_scrollbar']
 
         self.bottom_control_frame = bottom_control_widgets['bottom_control_frame']
@@ -227,9 +320,9 @@ class MainWindow:
         # Transcription layout
         self.transcription_frame.pack(fill=tk.BOTH, expand=True, padx=3, pady=1)
 
-        # History listbox with scrollbar
-        self.history_listbox_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 2))
-        self.history_listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        # History view with scrollbar
+        self.history_tree_frame.pack(fill=tk.BOTH, expand=True, pady=(0, 2))
+        self.history_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         self.history_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
 
         # Bottom control panel with main buttons and menu
@@ -241,136 +334,173 @@ class MainWindow:
         self.status_label.pack(side=tk.RIGHT)
         self.connection_indicator.pack(side=tk.RIGHT, padx=(0, 3))
     
-    def _process_gui_updates(self) -> None:
-        """Process queued GUI updates"""
-        processed = 0
-        try:
-            while True:
-                update_func = self.gui_queue.get_nowait()
-                update_func()
-                processed += 1
-        except queue.Empty:
-            pass
-        
-        if processed > 0:
-            logger.debug(f"Processed {processed} GUI updates")
-        
-        # Schedule next update check
-        if self.is_running and self.root:
-            self.root.after(100, self._process_gui_updates)
-    
     def _update_connection_status(self, status: str) -> None:
         """Update connection status display"""
         self.connection_status = status
+        if status == self._shown_connection_status:
+            return  # Widgets already show this status
+        self._shown_connection_status = status
 
         if status == "connected":
             self.connection_indicator.config(foreground="green")
             self.status_label.config(text="Connected")
-            self.record_button.config(state=tk.NORMAL)
+            self._configure_record_button(state=_NORMAL)
         elif status == "connecting":
             self.connection_indicator.config(foreground="orange")
             self.status_label.config(text="Connecting...")
-            self.record_button.config(state=tk.DISABLED)
+            self._configure_record_button(state=_DISABLED)
         elif status == "error":
             self.connection_indicator.config(foreground="red")
             self.status_label.config(text="Error - Click to retry")
-            self.record_button.config(state=tk.NORMAL)
+            self._configure_record_button(state=_NORMAL)
         else:
             self.connection_indicator.config(foreground="red")
             self.status_label.config(text="Disconnected")
-            self.record_button.config(state=tk.DISABLED)
+            self._configure_record_button(state=_DISABLED)
     
+    def _configure_record_button(self, **options: Any) -> None:
+        """Reconfigure the record button with only the options that changed"""
+        current = self._record_button_options
+        changed = {key: value for key, value in options.items() if current.get(key) != value}
+        if changed:
+            self.record_button.config(**changed)
+            current.update(changed)
+
     def _update_recording_state(self, state: str) -> None:
         """Update recording state display"""
-        logger.debug(f"Updating recording state: {self.recording_state} -> {state}")
+        if state == self.recording_state:
+            return  # Button already shows this state
+        logger.debug("Updating recording state: %s -> %s", self.recording_state, state)
         self.recording_state = state
 
         if state == "recording":
             # Stop icon - black square
-            self.record_button.config(text="⏹", fg='black', state=tk.NORMAL, relief=tk.SUNKEN)
-            logger.debug("Button updated to Stop icon")
+            self._configure_record_button(text="⏹", fg='black', state=_NORMAL, relief=_SUNKEN)
         elif state == "processing":
             # Hourglass - disabled state
-            self.record_button.config(text="⏳", fg='gray', state=tk.DISABLED, relief=tk.FLAT)
-            logger.debug("Button updated to Processing icon")
+            self._configure_record_button(text="⏳", fg='gray', state=_DISABLED, relief=_FLAT)
         else:
             # Red circle - ready to record
-            self.record_button.config(text="●", fg='red', state=tk.NORMAL, relief=tk.RAISED)
-            logger.debug("Button updated to Record icon")
+            self._configure_record_button(text="●", fg='red', state=_NORMAL, relief=_RAISED)
     
     def _add_recorded_entry(self, recording_id: str) -> None:
         """Add 'Recorded (not transcribed)' entry to history"""
+        timestamp = time.time()
         transcription_entry = {
             'text': None,  # No transcription yet
-            'timestamp': time.time(),
-            'datetime': time.strftime('%H:%M:%S', time.localtime()),
+            'timestamp': timestamp,
             'recording_id': recording_id,
             'status': 'recorded'  # recorded, transcribed
         }
-        self.transcription_history.append(transcription_entry)
+        self.transcription_history.appendleft(transcription_entry)
 
-        # Add to history listbox (newest at top)
-        display_text = f"[{transcription_entry['datetime']}] Recorded (not transcribed)"
-        self.history_listbox.insert(0, display_text)
+        # Add to history view (newest at top)
+        self._insert_history_rows([MainWindow._format_history_row(timestamp, None)])
 
         # Don't auto-enable transcribe button - let selection handler do it
         # This prevents confusion when entry is added but not selected
 
-        logger.info(f"Added recorded entry for recording {recording_id}")
+        logger.info("Added recorded entry for recording %s", recording_id)
+
+    def _flush_transcriptions(self) -> None:
+        """Apply all pending transcriptions, inserting their new rows together"""
+        self._transcription_flush_scheduled = False
+        pending, self._pending_transcriptions = self._pending_transcriptions, []
+        if not pending:
+            return
+
+        new_rows = []
+        for text, recording_id in pending:
+            display_text = self._update_transcription(text, recording_id, len(new_rows))
+            if display_text is not None:
+                new_rows.append(display_text)
 
-    def _update_transcription(self, text: str) -> None:
-        """Update transcription display - either add new or update existing entry"""
+        # Add to history view (newest at top)
+        if new_rows:
+            self._insert_history_rows(new_rows)
+
+        # Don't auto-enable buttons - let selection handler manage them
+        # This provides consistent behavior
+
+        # A recording started since these arrived still owns current_recording_id;
+        # leave its state alone rather than flipping the button back to ready
+        if self.current_recording_id is None:
+            self._update_recording_state("ready")
+
+    def _insert_history_rows(self, rows: List[str]) -> None:
+        """Insert rows (oldest first) at the top of the history view"""
+        # Treeview inserts at the front in constant time, unlike Listbox index 0
+        insert = self.history_tree.insert
+        for text in rows:
+            insert('', 0, iid=str(self._next_history_iid), text=text)
+            self._next_history_iid += 1
+        self._history_row_count += len(rows)
+
+        # Drop rows whose entries fell off the end of the bounded history
+        if self._history_row_count > len(self.transcription_history):
+            stale = self.history_tree.get_children()[len(self.transcription_history):]
+            self.history_tree.delete(*stale)
+            self._history_row_count -= len(stale)
+
+    def _history_selection(self) -> Tuple[int, ...]:
+        """History indices of the selected rows (rows and history are both newest first)"""
+        return tuple(self.history_tree.index(iid) for iid in self.history_tree.selection())
+
+    def _update_transcription(self, text: str, recording_id: Optional[str],
+                              unlisted: int = 0) -> Optional[str]:
+        """
+        Record a transcription - either update the recording's entry or add a new one
+
+        Returns the row text for a new entry (inserted by the caller), or
+        None when an existing entry was updated in place. unlisted is the
+        number of new entries already added to history but not yet shown.
+        """
         self.last_transcription = text
 
-        # Check if we should update an existing entry (current_recording_id match)
-        updated = False
-        if self.current_recording_id:
+        # Check if we should update an existing entry (recording_id match)
+        if recording_id:
             # Find entry with matching recording_id and update it
             for i, entry in enumerate(self.transcription_history):
-                if entry.get('recording_id') == self.current_recording_id and entry.get('status') == 'recorded':
+                if entry.get('recording_id') == recording_id and entry.get('status') == 'recorded':
                     # Update the entry
                     entry['text'] = text
                     entry['status'] = 'transcribed'
 
-                    # Update listbox display (history is reversed, newest first)
-                    listbox_index = len(self.transcription_history) - 1 - i
-                    display_text = f"[{entry['datetime']}] {text[:80]}{'...' if len(text) > 80 else ''}"
-                    self.history_listbox.delete(listbox_index)
-                    self.history_listbox.insert(listbox_index, display_text)
-
-                    updated = True
-                    logger.info(f"Updated transcription for recording {self.current_recording_id}")
-                    break
-
-        # If not updating existing, add new entry (for cases where we don't have recording_id)
-        if not updated:
-            transcription_entry = {
-                'text': text,
-                'timestamp': time.time(),
-                'datetime': time.strftime('%H:%M:%S', time.localtime()),
-                'recording_id': self.current_recording_id if self.current_recording_id else None,
-                'status': 'transcribed'
-            }
-            self.transcription_history.append(transcription_entry)
-
-            # Add to history listbox (newest at top)
-            display_text = f"[{transcription_entry['datetime']}] {text[:80]}{'...' if len(text) > 80 else ''}"
-            self.history_listbox.insert(0, display_text)
+                    # Update the row in place (both newest first, less rows not shown yet)
+                    iid = self.history_tree.get_children()[i - unlisted]
+                    display_text = MainWindow._format_history_row(entry['timestamp'], text)
+                    self.history_tree.item(iid, text=display_text)
 
-        # Don't auto-enable buttons - let selection handler manage them
-        # This provides consistent behavior
+                    logger.info("Updated transcription for recording %s", recording_id)
+                    self._finish_transcription(text, recording_id)
+                    return None
 
+        # Not updating existing, add new entry (for cases where we don't have recording_id)
+        timestamp = time.time()
+        transcription_entry = {
+            'text': text,
+            'timestamp': timestamp,
+            'recording_id': recording_id,
+            'status': 'transcribed'
+        }
+        self.transcription_history.appendleft(transcription_entry)
+
+        self._finish_transcription(text, recording_id)
+        return MainWindow._format_history_row(timestamp, text)
+
+    def _finish_transcription(self, text: str, recording_id: Optional[str]) -> None:
+        """Mirror a transcription into the history window and release its recording"""
         # Add history window entry
-        if hasattr(self, 'history_window') and self.history_window:
+        if self.history_window is not None:
             self.history_window.add_transcription(text)
 
-        # Reset recording state and clear current_recording_id
-        self.current_recording_id = None
-        self._update_recording_state("ready")
+        # Clear current_recording_id unless a newer recording has started
+        if self.current_recording_id == recording_id:
+            self.current_recording_id = None
     
     def _show_error(self, error_message: str) -> None:
         """Show error message in status display"""
-        logger.error(f"Error occurred: {error_message}")
+        logger.error("Error occurred: %s", error_message)
 
         # Update status to show error (non-blocking)
         self._update_connection_status("error")
@@ -395,18 +525,16 @@ class MainWindow:
     
     def _toggle_recording(self) -> None:
         """Toggle recording state using functional composition"""
-        import time
-
         # Debounce: Ignore rapid successive clicks (within 500ms)
         current_time = time.time()
         if hasattr(self, '_last_toggle_time'):
             time_since_last = (current_time - self._last_toggle_time) * 1000  # ms
             if time_since_last < 500:
-                logger.debug(f"Ignoring rapid button click - {time_since_last:.0f}ms since last click")
+                logger.debug("Ignoring rapid button click - %.0fms since last click", time_since_last)
                 return
 
         self._last_toggle_time = current_time
-        logger.info(f"GUI button clicked - current recording_state: {self.recording_state}")
+        logger.info("GUI button clicked - current recording_state: %s", self.recording_state)
 
         # Determine recording action based on current state
         hotkey = self.config.get('hotkey', 'ctrl+shift+w')
@@ -418,7 +546,7 @@ class MainWindow:
             is_recording_start = False
             action = "stop"
         else:
-            logger.warning(f"Cannot toggle recording from state: {self.recording_state}")
+            logger.warning("Cannot toggle recording from state: %s", self.recording_state)
             return
 
         # Use functional composition to create and publish event
@@ -428,7 +556,7 @@ class MainWindow:
         )
 
         if result.is_failure():
-            logger.error(f"Failed to {action} recording: {result.error}")
+            logger.error("Failed to %s recording: %s", action, result.error)
     
     # Pure UI builder functions (functional composition)
     def _create_bottom_control_widgets(self, transcription_frame) -> Dict[str, Any]:
@@ -446,7 +574,7 @@ class MainWindow:
             bg='#f0f0f0',
             activeforeground='darkred',
             activebackground='#e0e0e0',
-            relief=tk.RAISED,
+            relief=_RAISED,
             takefocus=False  # Prevent button from taking focus and being triggered by keyboard
         )
 
@@ -455,7 +583,7 @@ class MainWindow:
             bottom_control_frame,
             text="📝 Transcribe",
             command=self._transcribe_selected,
-            state=tk.DISABLED,
+            state=_DISABLED,
             width=12
         )
 
@@ -463,7 +591,7 @@ class MainWindow:
             bottom_control_frame,
             text="📋 Copy",
             command=self._copy_selected_transcription,
-            state=tk.DISABLED,
+            state=_DISABLED,
             width=8
         )
 
@@ -491,31 +619,39 @@ class MainWindow:
     def _create_transcription_widgets(self) -> Dict[str, Any]:
         """Pure function to create transcription history widgets"""
         transcription_frame = ttk.Frame(self.root, padding=2)
-        history_listbox_frame = ttk.Frame(transcription_frame)
+        history_tree_frame = ttk.Frame(transcription_frame)
         
-        history_listbox = tk.Listbox(
-            history_listbox_frame,
+        # Single-column tree used as a list: O(1) inserts at the top
+        ttk.Style(self.root).configure('History.Treeview', font=('Arial', 9))
+        history_tree = ttk.Treeview(
+            history_tree_frame,
+            show='tree',
             height=4,
-            width=60,
-            font=('Arial', 9),
-            selectmode=tk.SINGLE,
-            exportselection=False  # Prevent selection clearing
+            selectmode='browse',
+            style='History.Treeview'
         )
-        history_listbox.bind('<<ListboxSelect>>', self._on_history_select)
+        history_tree.column('#0', width=420, stretch=True)
+        history_tree.bind('<<TreeviewSelect>>', self._on_history_select)
         
-        history_scrollbar = ttk.Scrollbar(history_listbox_frame, orient="vertical", command=history_listbox.yview)
-        history_listbox.configure(yscrollcommand=history_scrollbar.set)
+        history_scrollbar = ttk.Scrollbar(history_tree_frame, orient="vertical", command=history_tree.yview)
+        history_tree.configure(yscrollcommand=history_scrollbar.set)
         
         return {
             'transcription_frame': transcription_frame,
-            'history_listbox_frame': history_listbox_frame,
-            'history_listbox': history_listbox,
+            'history_tree_frame': history_tree_frame,
+            'history_tree': history_tree,
             'history_scrollbar': history_scrollbar
         }
     
     
     def _get_current_hotkey(self) -> str:
-        """Pure function to get current hotkey"""
+        """Get the current hotkey, loading settings only on first use"""
+        if self._current_hotkey is None:
+            self._current_hotkey = self._load_current_hotkey()
+        return self._current_hotkey
+
+    def _load_current_hotkey(self) -> str:
+        """Read the hotkey from settings, falling back to config"""
         if self.settings_manager:
             settings_result = self.settings_manager.load_settings()
             if settings_result.is_success():
@@ -523,22 +659,31 @@ class MainWindow:
         return self.config.get('hotkey', 'ctrl+r')
     
     @staticmethod
+    @lru_cache(maxsize=8)
     def _format_hotkey_display(hotkey: str) -> str:
         """Pure function to format hotkey for display"""
         parts = []
         for part in hotkey.split('+'):
-            if part.lower() in ['ctrl', 'shift', 'alt', 'cmd']:
+            if part.lower() in _DISPLAY_MODIFIERS:
                 parts.append(part.capitalize())
             else:
                 parts.append(part.lower())
         return '+'.join(parts)
 
+    @staticmethod
+    def _format_history_row(timestamp: float, text: Optional[str]) -> str:
+        """Pure function to format a history entry for the history view"""
+        if text is None:
+            label = "Recorded (not transcribed)"
+        else:
+            label = text if len(text) <= 80 else text[:80] + '...'
+        return f"[{time.strftime('%H:%M:%S', time.localtime(timestamp))}] {label}"
+
     # Pure functions for recording operations (functional composition)
     @staticmethod
     def _create_hotkey_event(hotkey: str, is_recording_start: bool, source: str) -> Result[Any, str]:
         """Pure function to create hotkey pressed event"""
         try:
-            from shared.events import HotkeyPressedEvent
             event = HotkeyPressedEvent(
                 hotkey_combination=hotkey,
                 is_recording_start=is_recording_start,
@@ -549,32 +694,25 @@ class MainWindow:
             return Failure(f"Failed to create hotkey event: {e}")
     
     def _publish_event_async(self, event) -> Result[None, Exception]:
-        """Publish event using thread-safe utility"""
-        from client.voice_client_app import VoiceClientApplication
-        publisher = VoiceClientApplication.create_thread_safe_publisher(self.event_bus)
-        return publisher(event)
+        """Schedule an event bus publish on the owning event loop"""
+        try:
+            if self._loop is None:
+                self._loop = asyncio.get_event_loop()
+            self._loop.call_soon_threadsafe(self.event_bus.publish_nowait, event)
+            return Success(None)
+        except Exception as e:
+            return Failure(e)
 
     # Pure functions for clipboard operations (functional composition)
     @staticmethod
-    def _extract_selected_index(listbox_selection) -> Result[int, str]:
+    def _extract_selected_index(listbox_selection) -> Result[int, object]:
         """Pure function to extract selected index from listbox selection"""
         if not listbox_selection:
-            return Failure("No selection made")
+            return Failure(_NO_SELECTION)
         return Success(listbox_selection[0])
     
-    @staticmethod 
-    def _calculate_history_index(selected_index: int, history_length: int) -> Result[int, str]:
-        """Pure function to convert display index to history index"""
-        if selected_index >= history_length:
-            return Failure(f"Selected index {selected_index} exceeds history length {history_length}")
-        
-        history_index = history_length - 1 - selected_index
-        if 0 <= history_index < history_length:
-            return Success(history_index)
-        return Failure(f"Invalid history index {history_index}")
-    
     @staticmethod
-    def _extract_text_from_history(history: list, history_index: int) -> Result[str, str]:
+    def _extract_text_from_history(history: Deque, history_index: int) -> Result[str, str]:
         """Pure function to extract text from transcription history"""
         if 0 <= history_index < len(history):
             return Success(history[history_index]['text'])
@@ -582,8 +720,11 @@ class MainWindow:
     
     def _copy_to_clipboard_and_primary(self, text: str) -> Result[None, Exception]:
         """Copy text to both clipboard and primary selection"""
+        if pyperclip is None:
+            # Fallback to Tkinter only
+            return self._copy_to_tk_clipboard(text)
+
         try:
-            import pyperclip
             pyperclip.copy(text)
             
             # Set Tkinter clipboard and primary selection
@@ -591,54 +732,64 @@ class MainWindow:
                 self.root.clipboard_clear()
                 self.root.clipboard_append(text)
                 self.root.selection_clear()
+                self._primary_selection_text = text
                 self.root.selection_own()
-                self.root.selection_handle(lambda offset, length: text)
                 logger.debug("Set clipboard and primary selection")
             except Exception as e:
-                logger.error(f"Error setting primary selection: {e}")
+                logger.error("Error setting primary selection: %s", e)
             
-            # Also try xclip for primary selection
-            try:
-                import subprocess
-                subprocess.run(['xclip', '-selection', 'primary'], 
-                             input=text.encode(), check=False)
-                logger.debug("Set primary selection via xclip")
-            except Exception as e:
-                logger.debug(f"xclip not available: {e}")
+            # Also set primary selection via xclip, off the Tk event handler
+            if self._has_xclip:
+                if self._loop is None:
+                    self._loop = asyncio.get_event_loop()
+                self._loop.call_soon_threadsafe(asyncio.ensure_future,
+                                                self._set_primary_via_xclip(text))
             
             return Success(None)
             
-        except ImportError:
-            # Fallback to Tkinter only
-            self.root.clipboard_clear()
-            self.root.clipboard_append(text)
-            self.root.update()
-            return Success(None)
         except Exception as e:
             # Final fallback to Tkinter
-            try:
-                self.root.clipboard_clear()
-                self.root.clipboard_append(text)
-                self.root.update()
-                return Success(None)
-            except Exception as fallback_error:
-                return Failure(fallback_error)
+            return self._copy_to_tk_clipboard(text)
     
-    def _publish_copy_event(self, text: str, history_index: int) -> Result[None, Exception]:
-        """Publish transcription copied event"""
+    async def _set_primary_via_xclip(self, text: str) -> None:
+        """Hand text to xclip for the X primary selection"""
         try:
-            from .gui_events import TranscriptionCopiedEvent
-            event = TranscriptionCopiedEvent(
-                text=text,
-                transcription_id=str(history_index),
-                source="gui_history_copy"
+            process = await asyncio.create_subprocess_exec(
+                'xclip', '-selection', 'primary',
+                stdin=asyncio.subprocess.PIPE,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.DEVNULL
             )
-            loop = asyncio.get_event_loop()
-            loop.call_soon_threadsafe(lambda: asyncio.create_task(self.event_bus.publish(event)))
+            await process.communicate(text.encode())
+            logger.debug("Set primary selection via xclip")
+        except Exception as e:
+            logger.debug("xclip failed: %s", e)
+    
+    def _serve_primary_selection(self, offset: str, length: str) -> str:
+        """Selection handler returning the requested chunk of the copied text"""
+        start = int(offset)
+        return self._primary_selection_text[start:start + int(length)]
+
+    def _copy_to_tk_clipboard(self, text: str) -> Result[None, Exception]:
+        """Copy text to the Tk clipboard only"""
+        try:
+            # No root.update() here: re-entering the event loop from a click
+            # handler stalls it, and the app loop pumps Tk every few ms anyway
+            self.root.clipboard_clear()
+            self.root.clipboard_append(text)
             return Success(None)
         except Exception as e:
             return Failure(e)
     
+    def _publish_copy_event(self, text: str, history_index: int) -> Result[None, Exception]:
+        """Publish transcription copied event"""
+        event = TranscriptionCopiedEvent(
+            text=text,
+            transcription_id=str(history_index),
+            source="gui_history_copy"
+        )
+        return self._publish_event_async(event)
+    
     def _show_copy_confirmation(self) -> None:
         """Show brief copy confirmation in UI"""
         original_text = self.copy_selected_button.cget("text")
@@ -648,17 +799,14 @@ class MainWindow:
     def _copy_selected_transcription(self) -> None:
         """Copy selected transcription to clipboard using functional composition"""
         result = (
-            MainWindow._extract_selected_index(self.history_listbox.curselection())
-            .flat_map(lambda selected_index:
-                MainWindow._calculate_history_index(selected_index, len(self.transcription_history))
-                .flat_map(lambda history_index:
-                    MainWindow._extract_text_from_history(self.transcription_history, history_index)
-                    .flat_map(lambda text:
-                        self._copy_to_clipboard_and_primary(text)
-                        .flat_map(lambda _:
-                            self._publish_copy_event(text, history_index)
-                            .map(lambda _: (text, history_index))
-                        )
+            MainWindow._extract_selected_index(self._history_selection())
+            .flat_map(lambda history_index:
+                MainWindow._extract_text_from_history(self.transcription_history, history_index)
+                .flat_map(lambda text:
+                    self._copy_to_clipboard_and_primary(text)
+                    .flat_map(lambda _:
+                        self._publish_copy_event(text, history_index)
+                        .map(lambda _: (text, history_index))
                     )
                 )
             )
@@ -666,12 +814,10 @@ class MainWindow:
 
         if result.is_success():
             self._show_copy_confirmation()
+        elif result.error is _NO_SELECTION:
+            messagebox.showwarning("No Selection", "Please select a transcription to copy.")
         else:
-            error_msg = str(result.error)
-            if "No selection" in error_msg:
-                messagebox.showwarning("No Selection", "Please select a transcription to copy.")
-            else:
-                logger.error(f"Copy operation failed: {error_msg}")
+            logger.error("Copy operation failed: %s", result.error)
 
     def _transcribe_selected(self) -> None:
         """Transcribe selected recording"""
@@ -681,16 +827,15 @@ class MainWindow:
             return
 
         # Get selected index
-        selection = self.history_listbox.curselection()
+        selection = self._history_selection()
         if not selection:
             messagebox.showwarning("No Selection", "Please select a recording to transcribe.")
             return
 
-        selected_index = selection[0]
-        history_index = len(self.transcription_history) - 1 - selected_index
+        history_index = selection[0]
 
-        if history_index < 0 or history_index >= len(self.transcription_history):
-            logger.error(f"Invalid history index: {history_index}")
+        if history_index >= len(self.transcription_history):
+            logger.error("Invalid history index: %s", history_index)
             return
 
         entry = self.transcription_history[history_index]
@@ -714,7 +859,7 @@ class MainWindow:
         # Load recording from storage
         recording_data_result = self.recording_storage.get_recording_data(recording_id)
         if recording_data_result.is_failure():
-            logger.error(f"Failed to load recording: {recording_data_result.error}")
+            logger.error("Failed to load recording: %s", recording_data_result.error)
             messagebox.showerror("Load Error", f"Failed to load recording: {recording_data_result.error}")
             return
 
@@ -724,13 +869,10 @@ class MainWindow:
         self.current_recording_id = recording_id
 
         # Send for transcription via the transcription client
-        logger.info(f"Requesting transcription for recording {recording_id}")
+        logger.info("Requesting transcription for recording %s", recording_id)
 
         # Publish audio captured event to trigger transcription
         try:
-            from shared.events import AudioCapturedEvent
-            from client.pipeline.audio_pipeline import AudioData
-
             # Get recording info
             recording_result = self.recording_storage.get_recording(recording_id)
             if recording_result.is_failure():
@@ -744,27 +886,28 @@ class MainWindow:
             self._update_recording_state("processing")
 
             # Publish audio captured event
-            loop = asyncio.get_event_loop()
             event = AudioCapturedEvent(
                 audio_data=audio_data,
                 duration_seconds=recording.duration_seconds,
                 format=recording.format,
                 source="gui_retry"
             )
-            loop.call_soon_threadsafe(lambda: asyncio.create_task(self.event_bus.publish(event)))
+            publish_result = self._publish_event_async(event)
+            if publish_result.is_failure():
+                raise publish_result.error
 
             logger.info("Transcription request published")
 
         except Exception as e:
-            logger.error(f"Failed to request transcription: {e}")
+            logger.error("Failed to request transcription: %s", e)
             messagebox.showerror("Transcription Error", f"Failed to request transcription: {e}")
             self._update_recording_state("ready")
     
     def _show_full_history(self) -> None:
         """Show full history window"""
-        if hasattr(self, 'history_window') and self.history_window:
+        if self.history_window is not None:
             # Clear any old data and populate with current history
-            self.history_window.transcriptions = self.transcription_history.copy()
+            self.history_window.set_history(reversed(self.transcription_history))
             self.history_window.show(self.root)
     
     def _clear_transcription_history(self) -> None:
@@ -781,48 +924,52 @@ class MainWindow:
         
         if result:
             self.transcription_history.clear()
-            self.history_listbox.delete(0, tk.END)
-            self.copy_selected_button.config(state=tk.DISABLED)
+            self.history_tree.delete(*self.history_tree.get_children())
+            self._history_row_count = 0
+            self._set_selection_button_states(_DISABLED, _DISABLED)
             self.last_transcription = ""
     
     def _on_history_select(self, event) -> None:
-        """Handle history listbox selection"""
-        selection = self.history_listbox.curselection()
+        """Handle history view selection"""
+        selection = self._history_selection()
         if selection:
-            # Enable copy button
-            self.copy_selected_button.config(state=tk.NORMAL)
-
             # Enable transcribe button only for "recorded" status entries
-            selected_index = selection[0]
-            history_index = len(self.transcription_history) - 1 - selected_index
+            history_index = selection[0]
+            transcribe_state = _DISABLED
 
-            if 0 <= history_index < len(self.transcription_history):
+            if history_index < len(self.transcription_history):
                 entry = self.transcription_history[history_index]
                 # Only enable transcribe for recorded (not transcribed) entries
                 if entry.get('status') == 'recorded' and entry.get('recording_id'):
-                    self.transcribe_button.config(state=tk.NORMAL)
-                else:
-                    self.transcribe_button.config(state=tk.DISABLED)
-            else:
-                self.transcribe_button.config(state=tk.DISABLED)
+                    transcribe_state = _NORMAL
+
+            self._set_selection_button_states(_NORMAL, transcribe_state)
         else:
-            self.copy_selected_button.config(state=tk.DISABLED)
-            self.transcribe_button.config(state=tk.DISABLED)
+            self._set_selection_button_states(_DISABLED, _DISABLED)
+
+    def _set_selection_button_states(self, copy_state: str, transcribe_state: str) -> None:
+        """Set the copy and transcribe button states, skipping unchanged buttons"""
+        last_copy_state, last_transcribe_state = self._selection_button_states
+        if copy_state != last_copy_state:
+            self.copy_selected_button.config(state=copy_state)
+        if transcribe_state != last_transcribe_state:
+            self.transcribe_button.config(state=transcribe_state)
+        self._selection_button_states = (copy_state, transcribe_state)
     
     def _show_settings(self) -> None:
         """Show settings window"""
         try:
-            if hasattr(self, 'settings_window') and self.settings_window:
+            if self.settings_window is not None:
                 # Show existing settings window
                 result = self.settings_window.show(self.root)
                 if result.is_failure():
-                    logger.error(f"Failed to show settings window: {result.error}")
+                    logger.error("Failed to show settings window: %s", result.error)
                     messagebox.showerror("Error", f"Failed to show settings: {result.error}")
             else:
                 logger.warning("Settings window not available")
                 messagebox.showinfo("Settings", "Settings window not available")
         except Exception as e:
-            logger.error(f"Error showing settings: {e}")
+            logger.error("Error showing settings: %s", e)
             messagebox.showerror("Error", f"Failed to show settings: {e}")
     
     def _on_window_close(self) -> None:
@@ -840,33 +987,26 @@ class MainWindow:
     def _setup_gui_hotkeys(self) -> None:
         """Setup GUI-focused keyboard shortcuts as fallback for global hotkeys"""
         try:
-            # Load current hotkey setting from settings manager (live) or config fallback
-            if self.settings_manager:
-                settings_result = self.settings_manager.load_settings()
-                if settings_result.is_success():
-                    hotkey = settings_result.value.hotkey
-                else:
-                    hotkey = self.config.get('hotkey', 'ctrl+r')
-            elif hasattr(self, 'config') and 'hotkey' in self.config:
-                hotkey = self.config['hotkey']
-            else:
-                hotkey = 'ctrl+r'  # default
+            hotkey = self._get_current_hotkey()
                 
             # Convert hotkey format for tkinter (ctrl+shift+r -> <Control-Shift-r>)
             tk_hotkey = self._convert_hotkey_to_tk_format(hotkey)
+            self._bound_hotkey = hotkey
             
-            logger.info(f"Converting hotkey '{hotkey}' to tkinter format: '{tk_hotkey}'")
+            logger.info("Converting hotkey '%s' to tkinter format: '%s'", hotkey, tk_hotkey)
             
             # Note: Disabling GUI hotkey binding to prevent double firing with global hotkeys
             # Global hotkeys work across all applications, so GUI binding is redundant
             # self.root.bind_all(tk_hotkey, self._on_gui_hotkey)
             
-            logger.info(f"GUI hotkey disabled to prevent conflicts with global hotkey: {tk_hotkey}")
+            logger.info("GUI hotkey disabled to prevent conflicts with global hotkey: %s", tk_hotkey)
             
         except Exception as e:
-            logger.error(f"Failed to setup GUI hotkeys: {e}")
+            logger.error("Failed to setup GUI hotkeys: %s", e)
     
-    def _convert_hotkey_to_tk_format(self, hotkey: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=8)
+    def _convert_hotkey_to_tk_format(hotkey: str) -> str:
         """Convert hotkey format from 'ctrl+shift+r' to '<Control-Shift-r>'"""
         parts = hotkey.lower().split('+')
         tk_parts = []
@@ -889,24 +1029,14 @@ class MainWindow:
     def _on_gui_hotkey(self, event) -> None:
         """Handle GUI hotkey press (when window has focus)"""
         try:
-            logger.info(f"GUI hotkey triggered (window focused) - event: {event}")
-            logger.info(f"Event details - keysym: {event.keysym}, state: {event.state}, keycode: {event.keycode}")
+            logger.info("GUI hotkey triggered (window focused)")
+            logger.debug("Event details - keysym: %s, state: %s, keycode: %s",
+                         event.keysym, event.state, event.keycode)
             
             # Publish hotkey pressed event (same as global hotkey)
-            # Get current hotkey from settings (live reload) or fallback to config  
-            if self.settings_manager:
-                settings_result = self.settings_manager.load_settings()
-                if settings_result.is_success():
-                    hotkey = settings_result.value.hotkey
-                else:
-                    hotkey = self.config.get('hotkey', 'ctrl+r')
-            else:
-                hotkey = self.config.get('hotkey', 'ctrl+r')
+            hotkey = self._get_current_hotkey()
             is_recording_start = self.recording_state == "ready"
             
-            import asyncio
-            from shared.events import HotkeyPressedEvent
-            
             # Create and publish event
             event_obj = HotkeyPressedEvent(
                 hotkey_combination=hotkey,
@@ -914,58 +1044,67 @@ class MainWindow:
                 source="gui_hotkey"
             )
             
-            # Use call_soon_threadsafe to schedule the event publishing
-            loop = asyncio.get_event_loop()
-            loop.call_soon_threadsafe(
-                lambda: asyncio.create_task(self.event_bus.publish(event_obj))
-            )
+            publish_result = self._publish_event_async(event_obj)
+            if publish_result.is_failure():
+                raise publish_result.error
             
             logger.info("GUI hotkey event published")
             
         except Exception as e:
-            logger.error(f"Failed to handle GUI hotkey: {e}")
+            logger.error("Failed to handle GUI hotkey: %s", e)
     
+    def _build_hamburger_menu(self) -> tk.Menu:
+        """Create the hamburger menu; built once and reused for every click"""
+        menu = tk.Menu(self.root, tearoff=0)
+
+        # Create wrapper functions that close the menu after action
+        def close_menu_and_execute(action):
+            def wrapper():
+                self._close_hamburger_menu()
+                # Small delay to ensure menu is closed before action
+                self.root.after(50, action)
+            return wrapper
+
+        # Settings option
+        menu.add_command(label="⚙️ Settings", command=close_menu_and_execute(self._show_settings))
+
+        # View All History option
+        menu.add_command(label="📚 View All History", command=close_menu_and_execute(self._show_full_history))
+
+        # Clear History option
+        menu.add_command(label="🗑️ Clear History", command=close_menu_and_execute(self._clear_transcription_history))
+
+        menu.add_separator()
+
+        # Always on top toggle; label set each time the menu is shown
+        menu.add_command(label="", command=close_menu_and_execute(self._toggle_always_on_top))
+        self._topmost_menu_index = menu.index('end')
+
+        return menu
+
+    def _close_hamburger_menu(self) -> None:
+        """Unpost the hamburger menu and stop watching for outside clicks"""
+        try:
+            self._hamburger_menu.unpost()
+            self.root.unbind_all('<Button-1>')
+        except Exception:
+            pass
+
     def _show_hamburger_menu(self) -> None:
         """Show hamburger menu with secondary options"""
         try:
-            # Store reference to menu for proper cleanup
-            if hasattr(self, '_active_menu') and self._active_menu:
-                self._active_menu.destroy()
-
-            menu = tk.Menu(self.root, tearoff=0)
-            self._active_menu = menu
-
-            # Create wrapper functions that close the menu after action
-            def close_menu_and_execute(action):
-                def wrapper():
-                    try:
-                        menu.unpost()
-                        menu.destroy()
-                        self._active_menu = None
-                    except:
-                        pass
-                    # Small delay to ensure menu is closed before action
-                    self.root.after(50, action)
-                return wrapper
-
-            # Settings option
-            menu.add_command(label="⚙️ Settings", command=close_menu_and_execute(self._show_settings))
-
-            # View All History option
-            menu.add_command(label="📚 View All History", command=close_menu_and_execute(self._show_full_history))
-
-            # Clear History option
-            menu.add_command(label="🗑️ Clear History", command=close_menu_and_execute(self._clear_transcription_history))
-
-            menu.add_separator()
-
-            # Always on top toggle
+            if self._hamburger_menu is None:
+                self._hamburger_menu = self._build_hamburger_menu()
+            menu = self._hamburger_menu
+
             if self.always_on_top:
-                menu.add_command(label="📌 Disable Always on Top", command=close_menu_and_execute(self._toggle_always_on_top))
+                label = "📌 Disable Always on Top"
             else:
-                menu.add_command(label="📌 Enable Always on Top", command=close_menu_and_execute(self._toggle_always_on_top))
+                label = "📌 Enable Always on Top"
+            menu.entryconfigure(self._topmost_menu_index, label=label)
 
-            # Show the menu at the button location
+            # Show the menu at the button location, measured per click since
+            # window moves change it
             x = self.menu_button.winfo_rootx()
             y = self.menu_button.winfo_rooty() + self.menu_button.winfo_height()
 
@@ -974,21 +1113,15 @@ class MainWindow:
 
             # Set up click-outside detection
             def close_on_click_outside(event):
-                try:
-                    # Check if click is outside menu
-                    if event.widget != menu:
-                        menu.unpost()
-                        menu.destroy()
-                        self._active_menu = None
-                        self.root.unbind_all('<Button-1>')
-                except:
-                    pass
+                # Check if click is outside menu
+                if event.widget != menu:
+                    self._close_hamburger_menu()
 
             # Bind to detect clicks outside menu
             self.root.after(100, lambda: self.root.bind_all('<Button-1>', close_on_click_outside))
 
         except Exception as e:
-            logger.error(f"Failed to show hamburger menu: {e}")
+            logger.error("Failed to show hamburger menu: %s", e)
 
     def _toggle_always_on_top(self) -> None:
         """Toggle window always-on-top behavior"""
@@ -1002,37 +1135,21 @@ class MainWindow:
                 logger.info("Window set to normal behavior")
 
         except Exception as e:
-            logger.error(f"Failed to toggle always on top: {e}")
+            logger.error("Failed to toggle always on top: %s", e)
     
     def refresh_settings_display(self) -> None:
         """Refresh GUI display when settings change"""
         try:
-            # Get current hotkey from settings
-            if self.settings_manager:
-                settings_result = self.settings_manager.load_settings()
-                if settings_result.is_success():
-                    hotkey = settings_result.value.hotkey
-                else:
-                    hotkey = self.config.get('hotkey', 'ctrl+r')
-            else:
-                hotkey = self.config.get('hotkey', 'ctrl+r')
-            
-            # Format hotkey for display - capitalize modifiers but keep single chars lowercase
-            parts = []
-            for part in hotkey.split('+'):
-                if part.lower() in ['ctrl', 'shift', 'alt', 'cmd']:
-                    parts.append(part.capitalize())
-                else:
-                    # Keep single character keys lowercase
-                    parts.append(part.lower())
-            hotkey_display = '+'.join(parts)
+            # Settings just changed (this runs before the event is published): reload once
+            hotkey = self._current_hotkey = self._load_current_hotkey()
             
-            # Re-setup GUI hotkeys with new binding
-            self._setup_gui_hotkeys()
-            logger.info(f"GUI settings display refreshed for hotkey: {hotkey}")
+            # Re-setup GUI hotkeys only when the binding would change
+            if hotkey != self._bound_hotkey:
+                self._setup_gui_hotkeys()
+            logger.info("GUI settings display refreshed for hotkey: %s", hotkey)
             
         except Exception as e:
-            logger.error(f"Failed to refresh settings display: {e}")
+            logger.error("Failed to refresh settings display: %s", e)
     
     def destroy(self) -> None:
         """Destroy the window and cleanup"""
@@ -1042,9 +1159,9 @@ class MainWindow:
         if self.recording_storage:
             cleanup_result = self.recording_storage.cleanup()
             if cleanup_result.is_success():
-                logger.info(f"Cleaned up {cleanup_result.value} recording files")
+                logger.info("Cleaned up %s recording files", cleanup_result.value)
             else:
-                logger.warning(f"Failed to cleanup recordings: {cleanup_result.error}")
+                logger.warning("Failed to cleanup recordings: %s", cleanup_result.error)
 
         if self.root:
             self.root.destroy()
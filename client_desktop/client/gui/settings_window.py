@@ -9,13 +9,14 @@ server connection, and transcription options.
 
 import tkinter as tk
 from tkinter import ttk, messagebox
+import asyncio
 import logging
 from typing import Dict, Any, Callable, Optional
 
 from shared.functional import Result, Success, Failure
 from shared.events import EventBus
 from .gui_events import SettingsChangedEvent
-from ..settings import get_settings_manager, AppSettings
+from ..settings import get_settings_manager, AppSettings, VALID_MODELS
 
 logger = logging.getLogger(__name__)
 
@@ -38,6 +39,12 @@ class SettingsWindow:
                  config_file: Optional[str] = None):
         self.event_bus = event_bus
         self.on_settings_changed = on_settings_changed
+
+        # Loop that owns the event bus; captured when created inside it
+        try:
+            self._loop: Optional[asyncio.AbstractEventLoop] = asyncio.get_running_loop()
+        except RuntimeError:
+            self._loop = None
         
         # Initialize settings manager
         self.settings_manager = get_settings_manager(config_file)
@@ -47,7 +54,7 @@ class SettingsWindow:
         if settings_result.is_success():
             self.current_settings = settings_result.value
         else:
-            logger.warning(f"Failed to load settings: {settings_result.error}")
+            logger.warning("Failed to load settings: %s", settings_result.error)
             self.current_settings = AppSettings()
         
         self.root: Optional[tk.Toplevel] = None
@@ -84,8 +91,10 @@ class SettingsWindow:
             
             self.parent_window = parent_window
             
+            created = False
             if self.root is None:
                 self._create_window()
+                created = True
             else:
                 # Check if existing window is still valid
                 try:
@@ -94,15 +103,17 @@ class SettingsWindow:
                     logger.warning("Settings window was destroyed, recreating")
                     self.root = None
                     self._create_window()
+                    created = True
             
-            self.root.deiconify()
+            if not created:
+                self.root.deiconify()  # A new window is already mapped
             self.root.lift()
             self.root.focus()
             
             logger.info("Settings window shown")
             return Success(None)
         except Exception as e:
-            logger.error(f"Failed to show settings window: {e}")
+            logger.error("Failed to show settings window: %s", e)
             return Failure(e)
     
     def hide(self) -> Result[None, Exception]:
@@ -118,7 +129,7 @@ class SettingsWindow:
             logger.info("Settings window hidden")
             return Success(None)
         except Exception as e:
-            logger.error(f"Failed to hide settings window: {e}")
+            logger.error("Failed to hide settings window: %s", e)
             return Failure(e)
     
     def _create_window(self) -> None:
@@ -128,37 +139,41 @@ class SettingsWindow:
             
         try:
             self.root = tk.Toplevel(self.parent_window)
+            # Build while withdrawn so the window is painted once, fully laid out
+            self.root.withdraw()
             self.root.title("SpeakToMe Settings")
             self.root.geometry("600x500")
             self.root.resizable(True, True)
             self.root.minsize(550, 450)  # Set minimum size
             
-            # Make modal
-            self.root.transient(self.parent_window)
-            self.root.grab_set()
-            
             # Handle window close
             self.root.protocol("WM_DELETE_WINDOW", self._on_window_close)
             
-            # Center on parent
-            self._center_window()
-            
             self._create_widgets()
             self._setup_layout()
             
+            # Center on parent, now that the widgets' requested size is known
+            self._center_window()
+            
+            # Make modal; the grab needs the window to be viewable
+            self.root.transient(self.parent_window)
+            self.root.deiconify()
+            self.root.wait_visibility()
+            self.root.grab_set()
+            
             logger.info("Settings window created")
         except Exception as e:
-            logger.error(f"Failed to create settings window: {e}")
+            logger.error("Failed to create settings window: %s", e)
             raise
     
     def _center_window(self) -> None:
         """Center the window on the parent"""
         if self.parent_window:
             self.root.update_idletasks()
-            parent_x = self.parent_window.winfo_x()
-            parent_y = self.parent_window.winfo_y()
-            parent_width = self.parent_window.winfo_width()
-            parent_height = self.parent_window.winfo_height()
+            # One "WxH+X+Y" query instead of four winfo_* round-trips
+            size, parent_x, parent_y = self.parent_window.winfo_geometry().split('+', 2)
+            parent_width, parent_height = map(int, size.split('x'))
+            parent_x, parent_y = int(parent_x), int(parent_y)
             
             window_width = self.root.winfo_reqwidth()
             window_height = self.root.winfo_reqheight()
@@ -217,7 +232,7 @@ class SettingsWindow:
         # Model selection
         ttk.Label(parent_frame, text="Whisper Model:").grid(row=2, column=0, sticky="w", padx=10, pady=5)
         model_combo = ttk.Combobox(parent_frame, textvariable=self.model_var, 
-                                 values=['tiny', 'base', 'small', 'medium', 'large'],
+                                 values=VALID_MODELS,
                                  state="readonly", width=15)
         model_combo.grid(row=2, column=1, sticky="w", padx=10, pady=5)
         
@@ -371,10 +386,7 @@ class SettingsWindow:
                 changed_settings=updates,
                 source="settings_window"
             )
-            import asyncio
-            # Use call_soon_threadsafe to schedule the coroutine
-            loop = asyncio.get_event_loop()
-            loop.call_soon_threadsafe(lambda: asyncio.create_task(self.event_bus.publish(event)))
+            self._publish_event(event)
             
             # Close window
             self.hide()
@@ -382,9 +394,15 @@ class SettingsWindow:
         except ValueError as e:
             messagebox.showerror("Invalid Input", f"Please check your input values: {e}")
         except Exception as e:
-            logger.error(f"Failed to save settings: {e}")
+            logger.error("Failed to save settings: %s", e)
             messagebox.showerror("Error", f"Failed to save settings: {e}")
     
+    def _publish_event(self, event) -> None:
+        """Schedule an event bus publish on the owning event loop"""
+        if self._loop is None:
+            self._loop = asyncio.get_event_loop()
+        self._loop.call_soon_threadsafe(self.event_bus.publish_nowait, event)
+
     def _cancel_settings(self) -> None:
         """Cancel settings changes and close window"""
         # Reset form values to current settings
@@ -474,7 +492,7 @@ class SettingsWindow:
                 self.root = None
             logger.info("Settings window closed and destroyed")
         except Exception as e:
-            logger.error(f"Error closing settings window: {e}")
+            logger.error("Error closing settings window: %s", e)
             self.root = None
     
     def destroy(self) -> None:
@@ -10,13 +10,22 @@ functional programming patterns and proper error handling.
 import json
 import logging
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional, Tuple
+from dataclasses import dataclass, asdict, replace
 
 from shared.functional import Result, Success, Failure, from_callable
 
 logger = logging.getLogger(__name__)
 
+# Validation vocabularies, built once rather than on every validate call
+VALID_MODELS = ('tiny', 'base', 'small', 'medium', 'large')
+VALID_LOGGING_LEVELS = ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
+_HOTKEY_MODIFIERS = frozenset(('ctrl', 'shift', 'alt', 'cmd', 'meta'))
+_HOTKEY_KEYS = frozenset(
+    [*'abcdefghijklmnopqrstuvwxyz0123456789', 'space', 'enter', 'tab', 'esc', 'escape',
+     *(f'f{i}' for i in range(1, 13))]  # F1-F12
+)
+
 
 @dataclass
 class AppSettings:
@@ -42,6 +51,7 @@ class AppSettings:
     # UI settings
     ui_show_notifications: bool = True
     ui_recording_feedback: bool = True
+    ui_history_max_entries: int = 10000
     
     # Logging settings
     logging_level: str = "INFO"
@@ -76,11 +86,29 @@ class SettingsManager:
     def __init__(self, config_file: str = "voice_client_config.json"):
         self.config_file = Path(config_file)
         self._settings: Optional[AppSettings] = None
+        # (mtime_ns, size) of the file _settings was read from or written to
+        self._file_signature: Optional[Tuple[int, int]] = None
         
         logger.info(f"Settings manager initialized with config file: {self.config_file}")
     
+    def _stat_signature(self) -> Optional[Tuple[int, int]]:
+        """Signature identifying the current config file contents, None if missing"""
+        try:
+            stat = self.config_file.stat()
+        except OSError:
+            return None
+        return stat.st_mtime_ns, stat.st_size
+
     def load_settings(self) -> Result[AppSettings, Exception]:
-        """Load settings from file, creating defaults if file doesn't exist"""
+        """Load settings from file, creating defaults if file doesn't exist
+
+        Settings already read from an unchanged file are returned without re-reading it,
+        as a copy so callers can't mutate the cached instance.
+        """
+        signature = self._stat_signature()
+        if signature is not None and signature == self._file_signature and self._settings is not None:
+            return Success(replace(self._settings))
+
         def _load():
             if not self.config_file.exists():
                 logger.info("Config file doesn't exist, creating with defaults")
@@ -95,12 +123,13 @@ class SettingsManager:
                 data = json.load(f)
             
             settings = AppSettings.from_dict(data)
+            self._file_signature = signature
             logger.info("Settings loaded successfully")
             return settings
         
         result = from_callable(_load)
         if result.is_success():
-            self._settings = result.value
+            self._settings = replace(result.value)
         else:
             logger.error(f"Failed to load settings: {result.error}")
             # Fallback to defaults
@@ -127,7 +156,8 @@ class SettingsManager:
         
         result = from_callable(_save)
         if result.is_success():
-            self._settings = settings
+            self._settings = replace(settings)
+            self._file_signature = self._stat_signature()
         
         return result
     
@@ -172,24 +202,27 @@ class SettingsManager:
             return Failure(f"Server URL must start with 'ws://' or 'wss://': {settings.server_url}")
         
         # Validate model
-        valid_models = ['tiny', 'base', 'small', 'medium', 'large']
-        if settings.model not in valid_models:
-            return Failure(f"Invalid model '{settings.model}', must be one of: {valid_models}")
+        if settings.model not in VALID_MODELS:
+            return Failure(f"Invalid model '{settings.model}', must be one of: {list(VALID_MODELS)}")
         
         # Validate audio settings
         if settings.audio_sample_rate <= 0:
             return Failure("Audio sample rate must be positive")
         
-        if settings.audio_channels not in [1, 2]:
+        if settings.audio_channels not in (1, 2):
             return Failure("Audio channels must be 1 or 2")
         
         if settings.audio_chunk_size <= 0:
             return Failure("Audio chunk size must be positive")
         
+        # Validate history cap
+        if settings.ui_history_max_entries <= 0:
+            return Failure("History max entries must be positive")
+        
         # Validate logging level
-        valid_levels = ['DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL']
-        if settings.logging_level not in valid_levels:
-            return Failure(f"Invalid logging level '{settings.logging_level}', must be one of: {valid_levels}")
+        if settings.logging_level not in VALID_LOGGING_LEVELS:
+            return Failure(f"Invalid logging level '{settings.logging_level}', "
+                           f"must be one of: {list(VALID_LOGGING_LEVELS)}")
         
         return Success(settings)
     
@@ -210,19 +243,13 @@ class SettingsManager:
         if len(parts) < 2:
             return False
         
-        valid_modifiers = {'ctrl', 'shift', 'alt', 'cmd', 'meta'}
-        valid_keys = set('abcdefghijklmnopqrstuvwxyz0123456789')
-        valid_keys.update(['space', 'enter', 'tab', 'esc', 'escape'])
-        valid_keys.update([f'f{i}' for i in range(1, 13)])  # F1-F12
-        
         # Check that we have at least one modifier
-        modifiers = [part for part in parts[:-1] if part in valid_modifiers]
-        if not modifiers:
+        if not any(part in _HOTKEY_MODIFIERS for part in parts[:-1]):
             return False
         
         # Check that the last part is a valid key
         key = parts[-1]
-        if key not in valid_keys and len(key) != 1:
+        if key not in _HOTKEY_KEYS and len(key) != 1:
             return False
         
         return True
@@ -42,12 +42,13 @@ from .settings import get_settings_manager, AppSettings
 # GUI imports (optional - only imported if GUI is enabled)
 try:
     import tkinter as tk
+    import _tkinter
     from .gui import MainWindow, SettingsWindow, HistoryWindow
     GUI_AVAILABLE = True
 except ImportError:
     GUI_AVAILABLE = False
     MainWindow = SettingsWindow = HistoryWindow = None
-    tk = None
+    tk = _tkinter = None
 
 logger = logging.getLogger(__name__)
 
@@ -213,11 +214,18 @@ class VoiceClientApplication:
             if self.show_gui and self.gui_main_window:
                 # GUI mode - run Tkinter mainloop in main thread
                 # Use asyncio with tkinter integration
+                base_poll = self.config.ui_poll_interval_ms / 1000
+                max_poll = max(base_poll, self.config.ui_poll_max_interval_ms / 1000)
+                poll = base_poll
                 while self.running:
                     # Process tkinter events
                     if self.gui_main_window.root:
                         try:
-                            self.gui_main_window.root.update()
+                            # Same as root.update(), but counts the events handled
+                            do_one_event = self.gui_main_window.root.tk.dooneevent
+                            processed = 0
+                            while do_one_event(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
+                                processed += 1
                             # Check if GUI window was closed
                             if not self.gui_main_window.is_running:
                                 logger.info("GUI window closed, stopping application")
@@ -228,7 +236,9 @@ class VoiceClientApplication:
                             logger.info("GUI window destroyed, stopping application")
                             self.running = False
                             break
-                    await asyncio.sleep(0.01)  # 100 FPS for smooth GUI
+                        # Poll quickly while the GUI is busy, back off while idle
+                        poll = base_poll if processed else min(max_poll, poll * 2)
+                    await asyncio.sleep(poll)
             else:
                 # Headless mode - simple loop
                 while self.running:
@@ -661,7 +671,10 @@ class VoiceClientApplication:
             )
             
             # Create history window  
-            self.gui_history_window = HistoryWindow(self.event_bus)
+            self.gui_history_window = HistoryWindow(
+                self.event_bus,
+                max_entries=self.config.ui_history_max_entries
+            )
             
             # Connect history and settings windows to main window
             self.gui_main_window.history_window = self.gui_history_window
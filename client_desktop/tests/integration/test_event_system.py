@@ -68,6 +68,40 @@ class TestEventBusIntegration:
         assert len(received_events) == 1
         assert received_events[0].hotkey_combination == "ctrl+shift+t"
     
+    @pytest.mark.asyncio
+    async def test_publish_nowait(self, test_event_bus):
+        """Test fire-and-forget publication from loop callbacks"""
+        received_events = []
+        
+        def event_handler(event):
+            received_events.append(event)
+            return Success(None)
+        
+        test_event_bus.subscribe("hotkey.pressed", event_handler)
+        
+        # Schedule the way GUI code does from call_soon_threadsafe
+        loop = asyncio.get_running_loop()
+        loop.call_soon_threadsafe(test_event_bus.publish_nowait,
+                                  HotkeyPressedEvent(source="test"))
+        
+        await wait_for_condition(lambda: len(received_events) > 0)
+        assert len(received_events) == 1
+    
+    @pytest.mark.asyncio
+    async def test_handler_returning_none(self, test_event_bus, caplog):
+        """Test sync handlers may return None instead of Success(None)"""
+        received_events = []
+        
+        def event_handler(event):
+            received_events.append(event)
+        
+        test_event_bus.subscribe("hotkey.pressed", event_handler)
+        await test_event_bus.publish(HotkeyPressedEvent(source="test"))
+        
+        await wait_for_condition(lambda: len(received_events) > 0)
+        assert len(received_events) == 1
+        assert "Handler exception" not in caplog.text
+    
     @pytest.mark.asyncio
     async def test_multiple_handlers_same_event(self, test_event_bus):
         """Test multiple handlers for the same event type"""
@@ -201,27 +201,6 @@ class TestUIBuilderProperties:
 class TestFunctionalCompositionProperties:
     """Property-based tests for functional composition patterns"""
     
-    @given(st.lists(st.integers(), min_size=1, max_size=10))
-    def test_clipboard_index_conversion_inverse(self, history_length_list):
-        """Property: Index conversion should be its own inverse for valid ranges"""
-        for history_length in history_length_list:
-            if history_length <= 0:
-                continue
-                
-            # Test all valid indices
-            for selected_index in range(history_length):
-                # Convert display index to history index
-                result1 = MainWindow._calculate_history_index(selected_index, history_length)
-                
-                if result1.is_success():
-                    history_index = result1.value
-                    
-                    # Convert back (this tests the inverse property)
-                    back_to_selected = history_length - 1 - history_index
-                    
-                    # Property: Converting back should give original index
-                    assert back_to_selected == selected_index
-    
     @given(st.lists(dictionaries(
         keys=st.just('text'),
         values=st.text(min_size=1, max_size=100)
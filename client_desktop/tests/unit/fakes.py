@@ -0,0 +1,189 @@
+#!/usr/bin/env python3
+
+"""
+Tk Widget Fakes
+
+In-memory stand-ins for the Tk widgets the GUI unit tests drive, so those
+tests run without a display.
+"""
+
+import itertools
+import tkinter as tk
+
+
+class FakeRoot:
+    """Tk root stand-in that queues callbacks until run_idle() / run_timers()"""
+
+    def __init__(self):
+        self.idle = {}
+        self.timers = {}
+        self.clipboard = ""
+        self.destroyed = False
+        self._ids = itertools.count()
+
+    def clipboard_clear(self):
+        self.clipboard = ""
+
+    def clipboard_append(self, text):
+        self.clipboard += text
+
+    def after_idle(self, func, *args):
+        if self.destroyed:
+            raise tk.TclError("can't invoke \"after\" command: application has been destroyed")
+        after_id = f"after#{next(self._ids)}"
+        self.idle[after_id] = (func, args)
+        return after_id
+
+    def after(self, ms, func, *args):
+        after_id = f"after#{next(self._ids)}"
+        self.timers[after_id] = (func, args)
+        return after_id
+
+    def after_cancel(self, after_id):
+        self.timers.pop(after_id, None)
+        self.idle.pop(after_id, None)
+
+    def run_timers(self):
+        timers, self.timers = self.timers, {}
+        for func, args in timers.values():
+            func(*args)
+
+    def run_idle(self):
+        while self.idle:
+            func, args = self.idle.pop(next(iter(self.idle)))
+            func(*args)
+
+    def destroy(self):
+        self.destroyed = True
+
+
+class FakeTk:
+    """Tcl interpreter stand-in routing Treeview commands to a FakeTree"""
+
+    def __init__(self, tree):
+        self.tree = tree
+
+    def call(self, path, command, parent, index, *options):
+        assert path == self.tree._w and command == 'insert'
+        opts = dict(zip(options[::2], options[1::2]))
+        return self.tree.insert(parent, index, iid=opts['-id'], values=opts['-values'])
+
+
+class FakeTree:
+    """Treeview stand-in keeping rows as (iid, values) pairs, top first
+
+    A row inserted or updated with text= holds that text as its only value.
+    """
+
+    def __init__(self):
+        self.rows = []
+        self.selected = ()
+        self.insert_calls = 0
+        self._w = '.tree'
+        self.tk = FakeTk(self)
+
+    @property
+    def items(self):
+        return [values[0] for _, values in self.rows]
+
+    def insert(self, parent, index, iid=None, text=None, values=()):
+        assert iid not in self.get_children()
+        self.insert_calls += 1
+        row = (iid, (text,) if text is not None else tuple(values))
+        if index == 'end':
+            self.rows.append(row)
+        else:
+            self.rows.insert(index, row)
+        return iid
+
+    def item(self, iid, text):
+        self.rows[self.index(iid)] = (iid, (text,))
+
+    def item_values(self, iid):
+        return dict(self.rows)[iid]
+
+    def get_children(self, item=None):
+        return tuple(iid for iid, _ in self.rows)
+
+    def delete(self, *iids):
+        self.rows = [row for row in self.rows if row[0] not in iids]
+
+    def index(self, iid):
+        return self.get_children().index(iid)
+
+    def selection(self):
+        return self.selected
+
+    def selection_set(self, iid):
+        self.selected = (iid,)
+
+
+class FakeWidget:
+    """Widget stand-in accepting and remembering configuration"""
+
+    def __init__(self):
+        self.options = {}
+        self.config_calls = 0
+
+    def config(self, **options):
+        self.config_calls += 1
+        self.options.update(options)
+
+    configure = config
+
+
+class FakeScrollbar:
+    """Scrollbar stand-in remembering the last position"""
+
+    def __init__(self):
+        self.position = None
+
+    def set(self, first, last):
+        self.position = (first, last)
+
+
+class FakeText:
+    """Text widget stand-in counting content rewrites"""
+
+    # Class bindings, shared by every FakeText like Tk's are
+    bindings = {}
+    virtual_events = {'<<Copy>>': ('<Control-Key-c>', '<Key-F16>', '<Control-Key-Insert>'),
+                      '<<PrevWindow>>': ('<Shift-Key-Tab>', '<Key-ISO_Left_Tab>')}
+
+    def __init__(self):
+        self.content = ""
+        self.writes = 0
+
+    def config(self, **options):
+        pass
+
+    configure = config
+
+    def delete(self, start, end):
+        self.content = ""
+
+    def insert(self, index, text):
+        self.content = text
+        self.writes += 1
+
+    def replace(self, start, end, text):
+        self.content = text
+        self.writes += 1
+
+    def bind_class(self, tag, sequence, func):
+        FakeText.bindings[(tag, sequence)] = func
+
+    def bindtags(self, tags=None):
+        return ('Text',)
+
+    def event_info(self, virtual):
+        return FakeText.virtual_events[virtual]
+
+    def focus_set(self):
+        self.focused = True
+
+    def tk_focusNext(self):
+        return self.next_widget
+
+    def tk_focusPrev(self):
+        return self.prev_widget
@@ -0,0 +1,306 @@
+#!/usr/bin/env python3
+
+"""
+Test Dependency Injection Container
+
+Unit tests for client container registration and resolution.
+Tests lookup semantics across singleton, service, and factory registrations.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from client.container import ClientContainer, ClientConfig, get_container, set_container
+from tests.conftest import assert_result_success, assert_result_failure
+
+
+@pytest.fixture
+def container() -> ClientContainer:
+    """Provide an empty container"""
+    return ClientContainer(ClientConfig())
+
+
+class TestContainerResolution:
+    """Test service resolution through the merged registry"""
+
+    def test_get_singleton(self, container):
+        """Test singleton registration and lookup"""
+        instance = object()
+        container.register_singleton("bus", instance)
+
+        result = container.get("bus")
+        assert_result_success(result)
+        assert result.value is instance
+
+    def test_get_service(self, container):
+        """Test service registration and lookup"""
+        service = object()
+        container.register_service("svc", service)
+
+        result = container.get("svc")
+        assert_result_success(result)
+        assert result.value is service
+
+    def test_get_factory_creates_new_instances(self, container):
+        """Test factories are invoked on every lookup"""
+        container.register_factory("obj", object)
+
+        first = container.get("obj")
+        second = container.get("obj")
+        assert_result_success(first)
+        assert_result_success(second)
+        assert first.value is not second.value
+
+    def test_factory_failure(self, container):
+        """Test factory exceptions surface as Failure"""
+        def broken():
+            raise ValueError("boom")
+
+        container.register_factory("broken", broken)
+
+        result = container.get("broken")
+        assert_result_failure(result)
+        assert "Factory failed for broken" in result.error
+
+    def test_missing_service(self, container):
+        """Test unknown names return Failure"""
+        result = container.get("missing")
+        assert_result_failure(result)
+        assert result.error == "Service not found: missing"
+
+    def test_reregistration_overrides_kind(self, container):
+        """Test later registrations replace earlier ones regardless of kind"""
+        container.register_factory("name", object)
+        instance = object()
+        container.register_singleton("name", instance)
+
+        result = container.get("name")
+        assert_result_success(result)
+        assert result.value is instance
+
+    def test_get_or_create_registers_service(self, container):
+        """Test get_or_create registers the created instance"""
+        created = container.get_or_create("lazy", object)
+        assert_result_success(created)
+
+        assert container.get("lazy").value is created.value
+
+
+class TestResultCaching:
+    """Test reuse of Result wrappers across lookups"""
+
+    def test_singleton_result_is_reused(self, container):
+        """Test repeated singleton lookups return the same Success"""
+        container.register_singleton("bus", object())
+
+        assert container.get("bus") is container.get("bus")
+
+    def test_factory_result_is_fresh(self, container):
+        """Test factory lookups are never cached"""
+        container.register_factory("obj", object)
+
+        assert container.get("obj") is not container.get("obj")
+
+    def test_missing_result_is_reused(self, container):
+        """Test unknown-name Failures are shared"""
+        assert container.get("missing") is container.get("missing")
+
+
+class LifecycleService:
+    """Service with sync initialize and async cleanup hooks"""
+
+    def __init__(self):
+        self.initialized = False
+        self.cleaned_up = False
+
+    def initialize(self):
+        self.initialized = True
+
+    async def cleanup(self):
+        self.cleaned_up = True
+
+
+class TestServiceLifecycle:
+    """Test initialize/cleanup of registered services"""
+
+    @pytest.mark.asyncio
+    async def test_initialize_and_cleanup(self, container):
+        """Test sync and async hooks are both invoked"""
+        service = LifecycleService()
+        container.register_service("svc", service)
+
+        assert_result_success(await container.initialize_services())
+        await container.cleanup_services()
+
+        assert service.initialized
+        assert service.cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_initialize_failure(self, container):
+        """Test a failing initialize hook returns Failure"""
+        class Broken:
+            async def initialize(self):
+                raise RuntimeError("boom")
+
+        container.register_service("broken", Broken())
+
+        result = await container.initialize_services()
+        assert_result_failure(result)
+        assert result.error == "Service initialization failed: broken"
+
+    @pytest.mark.asyncio
+    async def test_reregistered_service_hooks_dropped(self, container):
+        """Test replacing a service with a singleton drops its hooks"""
+        service = LifecycleService()
+        container.register_service("svc", service)
+        container.register_singleton("svc", object())
+
+        assert_result_success(await container.initialize_services())
+        assert not service.initialized
+
+    def test_parallel_lifecycle_is_opt_in(self, container):
+        """Test hooks run one at a time unless parallel lifecycle is enabled"""
+        assert container.config.services_parallel_lifecycle is False
+
+    @pytest.mark.asyncio
+    async def test_async_hooks_run_concurrently(self, container):
+        """Test async initialize hooks overlap when parallel lifecycle is on"""
+        container.config.services_parallel_lifecycle = True
+
+        class SlowService:
+            async def initialize(self):
+                await asyncio.sleep(0.1)
+
+        for i in range(5):
+            container.register_service(f"slow_{i}", SlowService())
+
+        start = time.perf_counter()
+        assert_result_success(await container.initialize_services())
+        assert time.perf_counter() - start < 0.3
+
+    @pytest.mark.asyncio
+    async def test_sequential_lifecycle_preserves_order(self, container):
+        """Test disabling parallel lifecycle keeps registration order"""
+        container.config.services_parallel_lifecycle = False
+        order = []
+
+        class OrderedService:
+            def __init__(self, name):
+                self.name = name
+
+            async def initialize(self):
+                await asyncio.sleep(0.01 if self.name == "first" else 0)
+                order.append(self.name)
+
+        container.register_service("first", OrderedService("first"))
+        container.register_service("second", OrderedService("second"))
+
+        assert_result_success(await container.initialize_services())
+        assert order == ["first", "second"]
+
+
+class TestParallelLifecycle:
+    """Test ordering and failure handling with parallel lifecycle enabled"""
+
+    @pytest.fixture(autouse=True)
+    def parallel(self, container):
+        container.config.services_parallel_lifecycle = True
+
+    @pytest.mark.asyncio
+    async def test_sync_hook_waits_for_earlier_async_hooks(self, container):
+        """Test a sync hook still runs after the async hooks registered before it"""
+        order = []
+
+        class AsyncService:
+            async def initialize(self):
+                await asyncio.sleep(0.01)
+                order.append("async")
+
+        class SyncService:
+            def initialize(self):
+                order.append("sync")
+
+        container.register_service("async", AsyncService())
+        container.register_service("sync", SyncService())
+
+        assert_result_success(await container.initialize_services())
+        assert order == ["async", "sync"]
+
+    @pytest.mark.asyncio
+    async def test_initialize_failure_cancels_remaining(self, container):
+        """Test a failing initialize stops slower hooks and later services"""
+        later = LifecycleService()
+
+        class Broken:
+            async def initialize(self):
+                raise RuntimeError("boom")
+
+        class Slow:
+            finished = False
+
+            async def initialize(self):
+                await asyncio.sleep(0.2)
+                Slow.finished = True
+
+        class Barrier:
+            def initialize(self):
+                pass
+
+        container.register_service("broken", Broken())
+        container.register_service("slow", Slow())
+        container.register_service("barrier", Barrier())
+        container.register_service("later", later)
+
+        result = await container.initialize_services()
+        assert_result_failure(result)
+        assert result.error == "Service initialization failed: broken"
+        assert not Slow.finished
+        assert not later.initialized
+
+    @pytest.mark.asyncio
+    async def test_cleanup_runs_every_hook(self, container):
+        """Test cleanup keeps going after a failure"""
+        first, second = LifecycleService(), LifecycleService()
+
+        class Broken:
+            async def cleanup(self):
+                raise RuntimeError("boom")
+
+        container.register_service("first", first)
+        container.register_service("broken", Broken())
+        container.register_service("second", second)
+
+        await container.cleanup_services()
+        assert first.cleaned_up and second.cleaned_up
+
+    @pytest.mark.asyncio
+    async def test_self_cancelled_hook_is_a_failure(self, container):
+        """Test a hook raising CancelledError is reported rather than logged as completed"""
+        class Cancelling:
+            async def initialize(self):
+                raise asyncio.CancelledError()
+
+        container.register_service("cancelling", Cancelling())
+
+        result = await container.initialize_services()
+        assert_result_failure(result)
+        assert result.error == "Service initialization failed: cancelling"
+
+
+class TestGlobalContainer:
+    """Test the process-wide container accessor"""
+
+    def test_get_container_is_stable(self):
+        """Test repeated calls return the same instance"""
+        assert get_container() is get_container()
+
+    def test_set_container_replaces_global(self, container):
+        """Test set_container takes effect for subsequent lookups"""
+        previous = get_container()
+        try:
+            set_container(container)
+            assert get_container() is container
+        finally:
+            set_container(previous)
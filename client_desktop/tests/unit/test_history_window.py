@@ -0,0 +1,436 @@
+#!/usr/bin/env python3
+
+"""
+Test History Window
+
+Unit tests for transcription history bookkeeping and tree view updates.
+Uses an in-memory tree stand-in so no display is required.
+"""
+
+import json
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from shared.events import EventBus
+from client.gui.history_window import HistoryWindow
+from tests.unit.fakes import FakeRoot, FakeScrollbar, FakeText, FakeTree
+
+
+@pytest.fixture
+def history_window() -> HistoryWindow:
+    """Provide a history window with fake widgets attached"""
+    window = HistoryWindow(EventBus())
+    window.root = FakeRoot()
+    window.tree = FakeTree()
+    window.tree_scrollbar = FakeScrollbar()
+    window.details_text = FakeText()
+    return window
+
+
+class TestTreeUpdates:
+    """Test incremental tree view maintenance"""
+
+    def test_add_inserts_single_row_at_top(self, history_window):
+        """Test each add inserts one row, newest first"""
+        history_window.add_transcription("first")
+        history_window.root.run_idle()
+        history_window.add_transcription("second")
+        history_window.root.run_idle()
+
+        tree = history_window.tree
+        assert tree.insert_calls == 2
+        assert tree.get_children() == ("1", "0")
+
+    def test_burst_of_adds_flushes_once(self, history_window):
+        """Test adds within one event loop tick share a single idle flush"""
+        for text in ("a", "b", "c"):
+            history_window.add_transcription(text)
+
+        assert len(history_window.root.idle) == 1
+        assert history_window.tree.get_children() == ()
+
+        history_window.root.run_idle()
+        assert history_window.tree.get_children() == ("2", "1", "0")
+
+    def test_pending_adds_covered_by_rebuild(self, history_window):
+        """Test a rebuild before the flush does not duplicate rows"""
+        history_window.add_transcription("a")
+        history_window._refresh_tree_view()
+
+        history_window.root.run_idle()
+        assert history_window.tree.get_children() == ("0",)
+
+    def test_rebuild_matches_incremental_order(self, history_window):
+        """Test a full rebuild yields the same rows as incremental adds"""
+        for text in ("a", "b", "c"):
+            history_window.add_transcription(text)
+        history_window.root.run_idle()
+        incremental = list(history_window.tree.rows)
+
+        history_window._refresh_tree_view()
+
+        assert history_window.tree.rows == incremental
+
+    def test_large_rebuild_loads_newest_chunk(self, history_window):
+        """Test rebuilds insert only the newest chunk up front"""
+        history_window.FILL_CHUNK_SIZE = 2
+        history_window.set_history(
+            {'text': str(i), 'timestamp': float(i), 'datetime': ''} for i in range(5)
+        )
+
+        history_window.root.run_idle()
+        assert history_window.tree.get_children() == ("4", "3")
+
+    def test_scrolling_to_bottom_backfills(self, history_window):
+        """Test scrolling near the end of loaded rows loads older ones"""
+        history_window.FILL_CHUNK_SIZE = 2
+        history_window.set_history(
+            {'text': str(i), 'timestamp': float(i), 'datetime': ''} for i in range(5)
+        )
+
+        history_window._on_tree_scroll('0.0', '0.5')
+        history_window.root.run_idle()
+        assert history_window.tree.get_children() == ("4", "3")
+
+        for _ in range(3):
+            history_window._on_tree_scroll('0.5', '1.0')
+            history_window.root.run_idle()
+        assert history_window.tree.get_children() == ("4", "3", "2", "1", "0")
+        assert history_window.tree_scrollbar.position == ('0.5', '1.0')
+
+    def test_stale_backfill_is_dropped(self, history_window):
+        """Test a rebuild cancels back-fill scheduled for the previous rows"""
+        history_window.FILL_CHUNK_SIZE = 2
+        history_window.set_history(
+            {'text': str(i), 'timestamp': float(i), 'datetime': ''} for i in range(5)
+        )
+        history_window._on_tree_scroll('0.5', '1.0')
+        history_window.set_history([])
+
+        history_window.root.run_idle()
+        assert history_window.tree.get_children() == ()
+
+    def test_long_text_preview_is_truncated(self, history_window):
+        """Test preview column is capped at 50 characters"""
+        history_window.add_transcription("x" * 80)
+        history_window.root.run_idle()
+
+        _, preview = history_window.tree.item_values("0")
+        assert preview == "x" * 50 + "…"
+
+    def test_add_without_tree(self):
+        """Test adds before the window is built only record history"""
+        window = HistoryWindow(EventBus())
+        window.add_transcription("hello")
+
+        assert window.get_history_count() == 1
+
+
+class TestDestroy:
+    """Test tearing down the window and building it again"""
+
+    def test_destroy_cancels_pending_callbacks(self, history_window):
+        """Test queued flushes and details updates are dropped with the window"""
+        history_window.add_transcription("a")
+        history_window.root.run_idle()
+        history_window.tree.selection_set("0")
+        history_window._on_tree_select(None)
+        history_window.add_transcription("b")
+        root = history_window.root
+
+        history_window.destroy()
+
+        assert root.destroyed
+        assert root.idle == {} and root.timers == {}
+        assert history_window._details_after_id is None
+        assert history_window._iid_to_index == {}
+
+    def test_rebuilt_window_gets_new_rows(self, history_window):
+        """Test adds after a destroy and rebuild are flushed to the new tree"""
+        history_window.add_transcription("a")
+        history_window.destroy()
+
+        history_window.root = FakeRoot()
+        history_window.tree = FakeTree()
+        history_window.details_text = FakeText()
+        history_window._refresh_tree_view()
+        history_window.add_transcription("b")
+        history_window.root.run_idle()
+
+        assert history_window.tree.get_children() == ("1", "0")
+
+
+class TestHistoryStorage:
+    """Test column-wise history storage"""
+
+    def test_set_history_replaces_entries(self, history_window):
+        """Test set_history swaps in external entries and rebuilds the tree"""
+        history_window.add_transcription("old")
+        history_window.set_history([
+            {'text': 'one', 'timestamp': 1.0, 'datetime': '10:00:00',
+             'recording_id': 'abc', 'status': 'transcribed'},
+            {'text': None, 'timestamp': 2.0, 'datetime': '10:00:01',
+             'recording_id': 'def', 'status': 'recorded'},
+        ])
+
+        assert history_window.get_history_count() == 2
+        assert history_window.tree.get_children() == ("1", "0")
+
+        rows = list(history_window._iter_rows())
+        assert rows[0] == {
+            'text': 'one', 'timestamp': 1.0, 'datetime': '10:00:00',
+            'metadata': {'recording_id': 'abc', 'status': 'transcribed'}
+        }
+        assert rows[1]['text'] == ''
+
+    def test_set_history_derives_missing_datetime(self, history_window):
+        """Test entries without a display datetime get one from their timestamp"""
+        history_window.set_history([{'text': 'one', 'timestamp': 1000.0, 'status': 'transcribed'}])
+
+        (row,) = history_window._iter_rows()
+        assert row['datetime'] == time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(1000))
+        assert row['metadata'] == {'status': 'transcribed'}
+
+    def test_iter_rows_preserves_metadata(self, history_window):
+        """Test export rows carry per-entry metadata"""
+        history_window.add_transcription("hello", {'source': 'test'})
+
+        (row,) = history_window._iter_rows()
+        assert row['text'] == "hello"
+        assert row['metadata'] == {'source': 'test'}
+
+    def test_datetime_matches_timestamp(self, history_window):
+        """Test the display datetime is derived from the stored timestamp"""
+        history_window.add_transcription("hello")
+
+        (row,) = history_window._iter_rows()
+        expected = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(row['timestamp']))
+        assert row['datetime'] == expected
+
+
+class TestHistoryCap:
+    """Test the bound on stored transcriptions"""
+
+    def test_add_past_cap_drops_oldest(self, history_window):
+        """Test exceeding the cap trims the oldest entries plus slack"""
+        history_window.max_entries = 10
+        for i in range(11):
+            history_window.add_transcription(str(i))
+        history_window.root.run_idle()
+
+        assert history_window.get_history_count() == 9
+        assert [row['text'] for row in history_window._iter_rows()] == [str(i) for i in range(2, 11)]
+        assert history_window.tree.get_children() == tuple(str(i) for i in range(8, -1, -1))
+        assert history_window.tree.item_values("8")[1] == "10"
+
+    def test_set_history_keeps_newest(self, history_window):
+        """Test replacing history keeps only the newest max_entries"""
+        history_window.max_entries = 3
+        history_window.set_history(
+            {'text': str(i), 'timestamp': float(i), 'datetime': ''} for i in range(5)
+        )
+
+        assert [row['text'] for row in history_window._iter_rows()] == ["2", "3", "4"]
+
+    def test_trim_shifts_shown_index(self, history_window):
+        """Test the details pane index follows its entry across a trim"""
+        history_window.max_entries = 10
+        for i in range(10):
+            history_window.add_transcription(str(i))
+        history_window._show_details(5)
+
+        history_window.add_transcription("10")
+
+        assert history_window._shown_index == 3
+        assert history_window._texts[history_window._shown_index] == "5"
+
+
+class TestExport:
+    """Test history export formats"""
+
+    @pytest.fixture
+    def export_to(self, history_window, monkeypatch):
+        """Run _export_history against a given path with dialogs patched out"""
+        from client.gui import history_window as module
+
+        shown = []
+        monkeypatch.setattr(history_window, "_toast", lambda *a: shown.append(a))
+        monkeypatch.setattr(module.messagebox, "showerror", lambda *a, **k: shown.append(a))
+
+        def _export(path):
+            monkeypatch.setattr(module.filedialog, "asksaveasfilename", lambda **k: str(path))
+            history_window._export_history()
+            return shown
+
+        return _export
+
+    @pytest.mark.parametrize("encoder", ["default", "stdlib"])
+    def test_json_export_round_trips(self, history_window, export_to, tmp_path,
+                                     monkeypatch, encoder):
+        """Test JSON export produces a valid array of rows with either encoder"""
+        from client.gui import history_window as module
+
+        if encoder == "stdlib":
+            monkeypatch.setattr(module, "_dumps_row", module._json_dumps_row)
+        history_window.add_transcription("héllo")
+        history_window.add_transcription("world", {'n': 2})
+        path = tmp_path / "history.json"
+
+        export_to(path)
+
+        assert json.loads(path.read_text(encoding='utf-8')) == list(history_window._iter_rows())
+
+    def test_text_export_format(self, history_window, export_to, tmp_path):
+        """Test text export writes a timestamp header before each entry"""
+        history_window.add_transcription("hello")
+        path = tmp_path / "history.txt"
+
+        export_to(path)
+
+        (row,) = history_window._iter_rows()
+        assert path.read_text(encoding='utf-8') == f"[{row['datetime']}]\nhello\n\n"
+
+    def test_unknown_suffix_exports_text(self, history_window, export_to, tmp_path):
+        """Test files without a known suffix fall back to text"""
+        history_window.add_transcription("hello")
+        path = tmp_path / "history.log"
+
+        export_to(path)
+
+        assert path.read_text(encoding='utf-8').endswith("]\nhello\n\n")
+
+    def test_json_suffix_is_case_insensitive(self, history_window, export_to, tmp_path):
+        """Test an upper-case .JSON suffix still exports JSON"""
+        history_window.add_transcription("hello")
+        path = tmp_path / "history.JSON"
+
+        export_to(path)
+
+        assert json.loads(path.read_text(encoding='utf-8'))[0]['text'] == "hello"
+
+
+class TestDetailsPane:
+    """Test selection-driven details pane updates"""
+
+    def _select(self, window, iid):
+        window.tree.selection_set(iid)
+        window._on_tree_select(None)
+
+    def test_rapid_selection_coalesces(self, history_window):
+        """Test only the last of several quick selections is rendered"""
+        for text in ("a", "b", "c"):
+            history_window.add_transcription(text)
+        history_window.root.run_idle()
+
+        for iid in ("0", "1", "2"):
+            self._select(history_window, iid)
+        history_window.root.run_timers()
+
+        assert history_window.details_text.content == "c"
+        assert history_window.details_text.writes == 1
+
+    def test_reselecting_shown_row_is_skipped(self, history_window):
+        """Test selecting the already displayed row does no work"""
+        history_window.add_transcription("a")
+        history_window.root.run_idle()
+
+        self._select(history_window, "0")
+        history_window.root.run_timers()
+        self._select(history_window, "0")
+
+        assert history_window.root.timers == {}
+        assert history_window.details_text.writes == 1
+
+    def test_replacing_history_drops_pending_update(self, history_window):
+        """Test a selection pending across a history reset doesn't show the new entry at its index"""
+        history_window.add_transcription("a")
+        history_window.root.run_idle()
+        self._select(history_window, "0")
+
+        history_window.set_history([{'text': "b", 'timestamp': 0.0}])
+        history_window.root.run_timers()
+
+        assert history_window.details_text.writes == 0
+        assert history_window._details_after_id is None
+
+    def test_update_pending_at_destroy_is_dropped(self, history_window):
+        """Test a debounced update firing after destroy doesn't touch the dead pane"""
+        history_window.add_transcription("a")
+        history_window.root.run_idle()
+        self._select(history_window, "0")
+        root = history_window.root
+
+        history_window.destroy()
+        history_window.set_history([])
+        root.run_timers()
+
+        assert history_window._shown_index is None
+
+    def test_stale_index_is_ignored(self, history_window):
+        """Test a deferred update for an entry that no longer exists is dropped"""
+        history_window.add_transcription("a")
+
+        history_window._show_details(3)
+
+        assert history_window._shown_index is None
+        assert history_window.details_text.writes == 0
+
+
+class TestReadOnlyDetails:
+    """Test the details pane blocks edits but keeps copy and focus traversal"""
+
+    @pytest.fixture
+    def text(self, history_window, monkeypatch):
+        monkeypatch.setattr(FakeText, "bindings", {})
+        text = FakeText()
+        text.next_widget, text.prev_widget = FakeText(), FakeText()
+        history_window._make_read_only(text)
+        return text
+
+    def _press(self, text, sequence):
+        handler = FakeText.bindings[(HistoryWindow.READ_ONLY_BINDTAG, sequence)]
+        return handler(SimpleNamespace(widget=text))
+
+    @pytest.mark.parametrize("sequence", ["<Key>", "<<Paste>>", "<<Cut>>"])
+    def test_edits_are_blocked(self, text, sequence):
+        """Test typing, pasting and cutting stop before the Text class bindings"""
+        assert self._press(text, sequence) == 'break'
+
+    @pytest.mark.parametrize("sequence", ["<Control-c>", "<Control-Key-Insert>", "<Key-F16>"])
+    def test_copy_accelerators_pass_through(self, text, sequence):
+        """Test every platform copy sequence reaches the Text class"""
+        assert self._press(text, sequence) is None
+
+    def test_tab_moves_focus_forward(self, text):
+        """Test Tab leaves the pane instead of inserting a tab"""
+        assert self._press(text, "<Tab>") == 'break'
+        assert text.next_widget.focused
+
+    @pytest.mark.parametrize("sequence", ["<Shift-Key-Tab>", "<Key-ISO_Left_Tab>"])
+    def test_shift_tab_moves_focus_back(self, text, sequence):
+        """Test reverse traversal works with either Shift-Tab keysym"""
+        assert self._press(text, sequence) == 'break'
+        assert text.prev_widget.focused
+
+
+class TestCopy:
+    """Test copying the selected transcription"""
+
+    def test_clipboard_is_set_on_idle(self, history_window, monkeypatch):
+        """Test the copy returns before touching the clipboard"""
+        published, shown = [], []
+        monkeypatch.setattr(history_window, "_publish_event", published.append)
+        monkeypatch.setattr(history_window, "_toast", lambda *a: shown.append(a))
+        history_window.add_transcription("hello")
+        history_window.root.run_idle()
+        history_window.tree.selection_set("0")
+
+        history_window._copy_selected()
+        assert history_window.root.clipboard == ""
+        assert published[0].text == "hello"
+
+        history_window.root.run_idle()
+        assert history_window.root.clipboard == "hello"
+        assert shown == [("Transcription copied to clipboard!",)]
@@ -0,0 +1,485 @@
+#!/usr/bin/env python3
+
+"""
+Test Main Window
+
+Unit tests for main window state handling and GUI update scheduling.
+Runs without a display: a stand-in root replaces the Tk window.
+"""
+
+import asyncio
+import tkinter as tk
+from collections import deque
+
+import pytest
+
+from shared.events import (
+    EventBus, ConnectionStatusEvent, RecordingStartedEvent, RecordingStoppedEvent,
+    TranscriptionReceivedEvent
+)
+from client.gui.gui_events import SettingsChangedEvent
+from client.gui.main_window import MainWindow
+from client.settings import AppSettings
+from shared.functional import Failure, Success
+from tests.conftest import wait_for_condition
+from tests.unit.fakes import FakeRoot, FakeTree, FakeWidget
+
+
+@pytest.fixture
+def main_window() -> MainWindow:
+    """Provide a main window with fake widgets attached"""
+    window = MainWindow(EventBus(), {'hotkey': 'ctrl+shift+w'})
+    window.root = FakeRoot()
+    window.history_tree = FakeTree()
+    window.record_button = FakeWidget()
+    window.connection_indicator = FakeWidget()
+    window.status_label = FakeWidget()
+    window.copy_selected_button = FakeWidget()
+    window.transcribe_button = FakeWidget()
+    return window
+
+
+class TestGuiUpdateScheduling:
+    """Test marshalling of GUI updates onto Tk idle callbacks"""
+
+    def test_updates_run_on_idle_in_order(self, main_window):
+        """Test queued updates wait for Tk idle and keep their order"""
+        ran = []
+
+        main_window._queue_gui_update(ran.append, 1)
+        main_window._queue_gui_update(ran.append, 2)
+        assert ran == []
+
+        main_window.root.run_idle()
+        assert ran == [1, 2]
+
+    def test_stopped_recording_binds_id_at_event_time(self, main_window):
+        """Test the recorded entry uses the id current when recording stopped"""
+        main_window.current_recording_id = "rec-1"
+        main_window._handle_recording_stopped(RecordingStoppedEvent())
+        main_window.current_recording_id = "rec-2"
+
+        main_window.root.run_idle()
+
+        assert main_window.transcription_history[0]['recording_id'] == "rec-1"
+
+    def test_update_without_window_is_dropped(self, main_window):
+        """Test updates arriving before the window exists are ignored"""
+        main_window.root = None
+
+        main_window._queue_gui_update(lambda: None)
+
+    def test_update_after_destroy_is_dropped(self, main_window):
+        """Test a Tcl error from a destroyed root does not escape"""
+        main_window.root.destroyed = True
+
+        main_window._queue_gui_update(lambda: None)
+
+
+class TestStatusUpdates:
+    """Test skipping and coalescing of status display updates"""
+
+    def test_connection_events_collapse_to_latest(self, main_window):
+        """Test rapid connection events before idle draw only the last status"""
+        for status in ("connecting", "connected", "error"):
+            main_window._handle_connection_status(ConnectionStatusEvent(status=status))
+        assert len(main_window.root.idle) == 1
+
+        main_window.root.run_idle()
+
+        assert main_window.connection_status == "error"
+        assert main_window.status_label.config_calls == 1
+        assert main_window.status_label.options['text'] == "Error - Click to retry"
+
+    def test_unchanged_connection_status_is_skipped(self, main_window):
+        """Test a repeated status leaves the widgets alone"""
+        main_window._update_connection_status("connected")
+        main_window._update_connection_status("connected")
+
+        assert main_window.status_label.config_calls == 1
+
+    def test_first_connection_status_is_drawn(self, main_window):
+        """Test the initial status is applied even though it matches the default"""
+        main_window._update_connection_status("disconnected")
+
+        assert main_window.record_button.options['state'] == tk.DISABLED
+
+    def test_unchanged_recording_state_is_skipped(self, main_window):
+        """Test re-entering the current recording state leaves the button alone"""
+        main_window._update_recording_state("ready")
+        assert main_window.record_button.config_calls == 0
+
+        main_window._handle_recording_started(RecordingStartedEvent())
+        main_window._handle_recording_stopped(RecordingStoppedEvent())
+        main_window.root.run_idle()
+
+        assert main_window.recording_state == "processing"
+        assert main_window.record_button.config_calls == 1
+
+    def test_record_button_gets_only_changed_options(self, main_window):
+        """Test the record button is reconfigured with just the differing options"""
+        button = main_window.record_button
+        main_window._update_recording_state("recording")
+        main_window._update_connection_status("connected")
+        assert button.config_calls == 1
+
+        calls = []
+        button.config = lambda **options: calls.append(options)
+        main_window._update_recording_state("processing")
+        main_window._update_connection_status("error")
+
+        assert calls == [
+            {'text': "⏳", 'fg': 'gray', 'state': tk.DISABLED, 'relief': tk.FLAT},
+            {'state': tk.NORMAL},
+        ]
+
+
+class TestTranscriptionBatching:
+    """Test coalescing of transcription bursts"""
+
+    def _receive(self, window, text):
+        window._handle_transcription_received(TranscriptionReceivedEvent(text=text))
+
+    def test_burst_is_inserted_in_one_flush(self, main_window):
+        """Test transcriptions within the flush window share one view update"""
+        for text in ("one", "two", "three"):
+            self._receive(main_window, text)
+        assert len(main_window.root.timers) == 1
+
+        main_window.root.run_timers()
+
+        tree = main_window.history_tree
+        assert [item.split("] ")[1] for item in tree.items] == ["three", "two", "one"]
+        assert [entry['text'] for entry in main_window.transcription_history] == ["three", "two", "one"]
+
+    def test_recorded_entry_is_updated_in_place(self, main_window):
+        """Test a transcription fills in its recording's entry rather than adding one"""
+        main_window._add_recorded_entry("rec-1")
+        main_window._add_recorded_entry("rec-2")
+        main_window.current_recording_id = "rec-1"
+
+        self._receive(main_window, "hello")
+        main_window.current_recording_id = None
+        self._receive(main_window, "later")
+        main_window.root.run_timers()
+
+        history = main_window.transcription_history
+        assert [(e['recording_id'], e['text']) for e in history] == [
+            (None, "later"), ("rec-2", None), ("rec-1", "hello")
+        ]
+        items = main_window.history_tree.items
+        assert items[0].endswith("] later")
+        assert items[1].endswith("Recorded (not transcribed)")
+        assert items[2].endswith("] hello")
+
+    def test_history_cap_trims_view(self, main_window):
+        """Test entries dropped from the bounded history leave the view too"""
+        main_window.transcription_history = deque(maxlen=2)
+        for text in ("one", "two", "three"):
+            self._receive(main_window, text)
+        main_window.root.run_timers()
+
+        assert [entry['text'] for entry in main_window.transcription_history] == ["three", "two"]
+        assert [item.split("] ")[1] for item in main_window.history_tree.items] == ["three", "two"]
+
+    def test_recording_bound_when_received(self, main_window):
+        """Test a recording started before the flush keeps its own id"""
+        main_window.current_recording_id = "rec-1"
+        self._receive(main_window, "hello")
+        main_window.current_recording_id = "rec-2"
+
+        main_window.root.run_timers()
+
+        assert main_window.transcription_history[0]['recording_id'] == "rec-1"
+        assert main_window.current_recording_id == "rec-2"
+
+    @pytest.mark.parametrize("idle_first", [True, False])
+    def test_recording_started_before_flush_stays_recording(self, main_window, idle_first):
+        """Test a late flush does not reset a recording started after the transcription"""
+        main_window.current_recording_id = "rec-1"
+        main_window._update_recording_state("processing")
+        self._receive(main_window, "hello")
+        main_window._handle_recording_started(RecordingStartedEvent())
+
+        if idle_first:
+            main_window.root.run_idle()
+            main_window.root.run_timers()
+        else:
+            main_window.root.run_timers()
+            main_window.root.run_idle()
+
+        assert main_window.recording_state == "recording"
+        assert main_window.transcription_history[0]['text'] == "hello"
+
+    def test_flush_resets_to_ready_when_idle(self, main_window):
+        """Test the flush returns the button to ready once its recording is done"""
+        main_window.current_recording_id = "rec-1"
+        main_window._update_recording_state("processing")
+        self._receive(main_window, "hello")
+
+        main_window.root.run_timers()
+
+        assert main_window.recording_state == "ready"
+        assert main_window.current_recording_id is None
+
+    def test_reselecting_keeps_button_states(self, main_window):
+        """Test repeated selection events only reconfigure buttons that change"""
+        main_window._add_recorded_entry("rec-1")
+        self._receive(main_window, "hello")
+        main_window.root.run_timers()
+        tree = main_window.history_tree
+        copy_button, transcribe_button = main_window.copy_selected_button, main_window.transcribe_button
+
+        tree.selected = (tree.get_children()[1],)
+        main_window._on_history_select(None)
+        main_window._on_history_select(None)
+        assert (copy_button.config_calls, transcribe_button.config_calls) == (1, 1)
+
+        tree.selected = (tree.get_children()[0],)
+        main_window._on_history_select(None)
+        assert copy_button.config_calls == 1
+        assert transcribe_button.options['state'] == tk.DISABLED
+
+    def test_selection_maps_to_history_index(self, main_window):
+        """Test a selected row resolves to its history entry after later inserts"""
+        for text in ("one", "two"):
+            self._receive(main_window, text)
+            main_window.root.run_timers()
+        tree = main_window.history_tree
+        tree.selected = (tree.get_children()[1],)
+
+        assert main_window._history_selection() == (1,)
+        assert main_window.transcription_history[1]['text'] == "one"
+
+
+class TestHistoryCap:
+    """Test the in-memory transcription history bound"""
+
+    @pytest.mark.parametrize("configured, expected", [(0, 1), (-5, 1), ("25", 25)])
+    def test_cap_is_clamped_to_a_usable_size(self, configured, expected):
+        """Test zero, negative and string caps still give a working history"""
+        window = MainWindow(EventBus(), {'ui_history_max_entries': configured})
+
+        assert window.transcription_history.maxlen == expected
+
+
+class TestEventPublishing:
+    """Test publishing GUI events onto the event bus loop"""
+
+    @pytest.mark.asyncio
+    async def test_publish_runs_on_cached_loop(self, main_window, test_event_bus):
+        """Test events published from the GUI reach bus subscribers"""
+        received = []
+        test_event_bus.subscribe("transcription.copied", received.append)
+        main_window.event_bus = test_event_bus
+        main_window._loop = asyncio.get_running_loop()
+
+        result = main_window._publish_copy_event("hello", 0)
+        assert result.is_success()
+
+        assert await wait_for_condition(lambda: received)
+        assert received[0].text == "hello"
+
+
+class CountingSettingsManager:
+    """Settings manager stand-in counting loads"""
+
+    def __init__(self, hotkey):
+        self.hotkey = hotkey
+        self.loads = 0
+
+    def load_settings(self):
+        self.loads += 1
+        return Success(AppSettings(hotkey=self.hotkey))
+
+
+class TestHotkeyCache:
+    """Test the cached current hotkey"""
+
+    def test_settings_loaded_once(self, main_window):
+        """Test repeated hotkey lookups read settings only the first time"""
+        manager = main_window.settings_manager = CountingSettingsManager('ctrl+alt+r')
+
+        assert main_window._get_current_hotkey() == 'ctrl+alt+r'
+        assert main_window._get_current_hotkey() == 'ctrl+alt+r'
+        assert manager.loads == 1
+
+    def test_settings_changed_event_updates_hotkey(self, main_window):
+        """Test a settings change replaces the cached hotkey without a reload"""
+        manager = main_window.settings_manager = CountingSettingsManager('ctrl+alt+r')
+        main_window._get_current_hotkey()
+
+        main_window._handle_settings_changed(SettingsChangedEvent(changed_settings={'hotkey': 'ctrl+q'}))
+
+        assert main_window._get_current_hotkey() == 'ctrl+q'
+        assert manager.loads == 1
+
+    def test_without_settings_manager_uses_config(self, main_window):
+        """Test the config hotkey is used when no settings manager is attached"""
+        assert main_window._get_current_hotkey() == 'ctrl+shift+w'
+
+    def test_refresh_skips_setup_for_same_hotkey(self, main_window, monkeypatch):
+        """Test refreshing settings only re-runs hotkey setup after a change"""
+        manager = main_window.settings_manager = CountingSettingsManager('ctrl+alt+r')
+        main_window._setup_gui_hotkeys()
+        setups = []
+        real_setup = main_window._setup_gui_hotkeys
+        monkeypatch.setattr(main_window, "_setup_gui_hotkeys", lambda: setups.append(real_setup()))
+
+        main_window.refresh_settings_display()
+        assert setups == []
+
+        manager.hotkey = 'ctrl+q'
+        main_window.refresh_settings_display()
+        main_window.refresh_settings_display()
+        assert len(setups) == 1
+
+
+class TestHotkeyFormatting:
+    """Test the memoized hotkey conversions"""
+
+    def test_convert_to_tk_format(self):
+        """Test modifiers map to Tk names and the key stays lowercase"""
+        assert MainWindow._convert_hotkey_to_tk_format('ctrl+shift+R') == '<Control-Shift-r>'
+        assert MainWindow._convert_hotkey_to_tk_format('cmd+w') == '<Meta-w>'
+
+    def test_repeated_hotkey_hits_cache(self):
+        """Test the same hotkey string is formatted once"""
+        MainWindow._format_hotkey_display.cache_clear()
+
+        MainWindow._format_hotkey_display('ctrl+alt+x')
+        MainWindow._format_hotkey_display('ctrl+alt+x')
+
+        assert MainWindow._format_hotkey_display.cache_info().hits == 1
+
+
+class TestPrimarySelection:
+    """Test serving the PRIMARY selection"""
+
+    def test_serves_requested_chunk(self, main_window):
+        """Test the handler returns the slice Tk asks for, as strings"""
+        main_window._primary_selection_text = "hello world"
+
+        assert main_window._serve_primary_selection("0", "5") == "hello"
+        assert main_window._serve_primary_selection("6", "4000") == "world"
+        assert main_window._serve_primary_selection("11", "4000") == ""
+
+
+class TestCopySelected:
+    """Test error routing when copying the selected transcription"""
+
+    @pytest.fixture
+    def warnings(self, monkeypatch):
+        shown = []
+        monkeypatch.setattr("client.gui.main_window.messagebox.showwarning",
+                            lambda title, message: shown.append(title))
+        return shown
+
+    def test_empty_selection_warns(self, main_window, warnings):
+        """Test copying with nothing selected shows the no-selection warning"""
+        main_window._copy_selected_transcription()
+
+        assert warnings == ["No Selection"]
+
+    def test_other_failures_are_logged_not_shown(self, main_window, warnings, monkeypatch):
+        """Test a failure after selection is logged without the warning dialog"""
+        monkeypatch.setattr(main_window, "_history_selection", lambda: (3,))
+
+        main_window._copy_selected_transcription()
+
+        assert warnings == []
+
+    def test_failure_text_matching_old_message_is_logged(self, main_window, warnings, monkeypatch):
+        """Test a later failure whose text reads like a missing selection isn't mistaken for one"""
+        monkeypatch.setattr(main_window, "_history_selection", lambda: (0,))
+        monkeypatch.setattr(MainWindow, "_extract_text_from_history",
+                            staticmethod(lambda history, index: Failure("No selection made")))
+
+        main_window._copy_selected_transcription()
+
+        assert warnings == []
+
+
+class FakeMenu:
+    """Menu stand-in recording entries and posts"""
+
+    built = 0
+
+    def __init__(self, master, tearoff):
+        FakeMenu.built += 1
+        self.entries = []
+        self.posts = []
+
+    def add_command(self, label, command):
+        self.entries.append({'label': label, 'command': command})
+
+    def add_separator(self):
+        self.entries.append({'label': None})
+
+    def index(self, index):
+        assert index == 'end'
+        return len(self.entries) - 1
+
+    def entryconfigure(self, index, **options):
+        self.entries[index].update(options)
+
+    def tk_popup(self, x, y):
+        self.posts.append((x, y))
+
+    def unpost(self):
+        pass
+
+
+class FakeMenuButton(FakeWidget):
+    """Menu button stand-in with movable screen geometry"""
+
+    def __init__(self):
+        super().__init__()
+        self.x = 10
+
+    def winfo_rootx(self):
+        return self.x
+
+    def winfo_rooty(self):
+        return 20
+
+    def winfo_height(self):
+        return 30
+
+
+class TestHamburgerMenu:
+    """Test reuse of the hamburger menu"""
+
+    @pytest.fixture
+    def menu_window(self, main_window, monkeypatch):
+        monkeypatch.setattr(tk, "Menu", FakeMenu)
+        FakeMenu.built = 0
+        main_window.menu_button = FakeMenuButton()
+        main_window.always_on_top = True
+        return main_window
+
+    def test_menu_is_built_once(self, menu_window):
+        """Test repeated clicks post the same menu below the button"""
+        menu_window._show_hamburger_menu()
+        menu_window._show_hamburger_menu()
+
+        assert FakeMenu.built == 1
+        assert menu_window._hamburger_menu.posts == [(10, 50), (10, 50)]
+
+    def test_topmost_label_follows_state(self, menu_window):
+        """Test the always-on-top entry is relabelled for the current state"""
+        menu_window._show_hamburger_menu()
+        entry = menu_window._hamburger_menu.entries[-1]
+        assert entry['label'] == "📌 Disable Always on Top"
+
+        menu_window.always_on_top = False
+        menu_window._show_hamburger_menu()
+        assert entry['label'] == "📌 Enable Always on Top"
+
+    def test_position_follows_the_button(self, menu_window):
+        """Test each click posts the menu below the button's current position"""
+        menu_window._show_hamburger_menu()
+        menu_window.menu_button.x = 110
+        menu_window._show_hamburger_menu()
+
+        assert menu_window._hamburger_menu.posts == [(10, 50), (110, 50)]
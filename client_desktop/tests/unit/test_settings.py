@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+
+"""
+Test Settings Manager
+
+Unit tests for settings persistence and load caching.
+"""
+
+import json
+import os
+
+import pytest
+
+from client.settings import SettingsManager, AppSettings
+from tests.conftest import assert_result_success
+
+
+@pytest.fixture
+def settings_file(tmp_path):
+    """Provide a settings file with a custom hotkey"""
+    path = tmp_path / "config.json"
+    path.write_text(json.dumps(AppSettings(hotkey="ctrl+alt+r").to_dict()))
+    return path
+
+
+def count_opens(monkeypatch):
+    """Count file opens performed by the settings module"""
+    opened = []
+    real_open = open
+
+    def counting_open(*args, **kwargs):
+        opened.append(args[0])
+        return real_open(*args, **kwargs)
+
+    monkeypatch.setattr("builtins.open", counting_open)
+    return opened
+
+
+class TestLoadCaching:
+    """Test reuse of settings read from an unchanged file"""
+
+    def test_unchanged_file_is_read_once(self, settings_file, monkeypatch):
+        """Test repeated loads reuse the parsed settings"""
+        manager = SettingsManager(str(settings_file))
+        opened = count_opens(monkeypatch)
+
+        first = manager.load_settings()
+        second = manager.load_settings()
+
+        assert_result_success(first)
+        assert second.value == first.value
+        assert len(opened) == 1
+
+    def test_cached_settings_are_isolated_from_callers(self, settings_file):
+        """Test mutating loaded settings doesn't leak into later loads"""
+        manager = SettingsManager(str(settings_file))
+        manager.load_settings().value.hotkey = "ctrl+q"
+
+        assert manager.load_settings().value.hotkey == "ctrl+alt+r"
+
+    def test_saved_settings_are_isolated_from_callers(self, settings_file):
+        """Test mutating settings after saving them doesn't change the cache"""
+        manager = SettingsManager(str(settings_file))
+        settings = AppSettings(hotkey="ctrl+q")
+        assert_result_success(manager.save_settings(settings))
+        settings.hotkey = "ctrl+w"
+
+        assert manager.load_settings().value.hotkey == "ctrl+q"
+
+    def test_modified_file_is_reread(self, settings_file):
+        """Test an external edit is picked up on the next load"""
+        manager = SettingsManager(str(settings_file))
+        assert manager.load_settings().value.hotkey == "ctrl+alt+r"
+
+        settings_file.write_text(json.dumps(AppSettings(hotkey="ctrl+shift+q").to_dict()))
+        stat = settings_file.stat()
+        os.utime(settings_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert manager.load_settings().value.hotkey == "ctrl+shift+q"
+
+    def test_saved_settings_are_not_reread(self, settings_file, monkeypatch):
+        """Test settings just written are served without reading them back"""
+        manager = SettingsManager(str(settings_file))
+        updated = manager.update_settings({'hotkey': 'ctrl+q'})
+        assert_result_success(updated)
+        opened = count_opens(monkeypatch)
+
+        assert manager.load_settings().value == updated.value
+        assert opened == []
+
+
+class TestValidation:
+    """Test settings and hotkey validation"""
+
+    @pytest.fixture
+    def manager(self, tmp_path):
+        return SettingsManager(str(tmp_path / "config.json"))
+
+    @pytest.mark.parametrize("hotkey", ["ctrl+r", "Ctrl+Shift+W", "alt+f12", "ctrl+space", "cmd+;"])
+    def test_valid_hotkeys(self, manager, hotkey):
+        """Test modifier plus key combinations are accepted"""
+        assert manager._validate_hotkey(hotkey)
+
+    @pytest.mark.parametrize("hotkey", ["", "r", "ctrl", "r+ctrl", "shift+pageup"])
+    def test_invalid_hotkeys(self, manager, hotkey):
+        """Test combinations without a modifier or a valid key are rejected"""
+        assert not manager._validate_hotkey(hotkey)
+
+    def test_unknown_model_lists_choices(self, manager):
+        """Test an unknown model fails with the valid choices in order"""
+        result = manager.validate_settings(AppSettings(model="huge"))
+
+        assert result.is_failure()
+        assert result.error == ("Invalid model 'huge', must be one of: "
+                                "['tiny', 'base', 'small', 'medium', 'large']")
@@ -8,10 +8,12 @@ Provides consistent event handling patterns across both components.
 """
 
 import asyncio
+import functools
 import logging
+import sys
 import time
 import uuid
-from typing import Any, Callable, Dict, List, Optional, Type, TypeVar, Generic
+from typing import Any, Callable, ClassVar, Dict, List, Optional, Type, TypeVar, Generic
 from dataclasses import dataclass, field
 from abc import ABC, abstractmethod
 from enum import Enum
@@ -23,6 +25,9 @@ logger = logging.getLogger(__name__)
 # Event types
 T = TypeVar('T')
 
+# Dataclass decorator for events: slotted instances where supported (3.10+)
+event_dataclass = functools.partial(dataclass, slots=True) if sys.version_info >= (3, 10) else dataclass
+
 
 class EventPriority(Enum):
     """Event processing priority levels"""
@@ -32,7 +37,7 @@ class EventPriority(Enum):
     CRITICAL = 4
 
 
-@dataclass
+@event_dataclass
 class BaseEvent(ABC):
     """Base class for all events in the system"""
     event_id: str = field(default_factory=lambda: str(uuid.uuid4()))
@@ -44,70 +49,64 @@ class BaseEvent(ABC):
     @property
     @abstractmethod
     def event_type(self) -> str:
-        """Return the event type identifier"""
+        """
+        Return the event type identifier
+        
+        Concrete events override this with a ClassVar[str] constant.
+        """
         pass
 
 
 # Client-specific events
-@dataclass
+@event_dataclass
 class HotkeyPressedEvent(BaseEvent):
     """Event fired when global hotkey is pressed"""
     hotkey_combination: str = ""
     is_recording_start: bool = False
     
-    @property
-    def event_type(self) -> str:
-        return "hotkey.pressed"
+    event_type: ClassVar[str] = "hotkey.pressed"
 
 
-@dataclass
+@event_dataclass
 class RecordingStartedEvent(BaseEvent):
     """Event fired when audio recording starts"""
     sample_rate: int = 16000
     channels: int = 1
     device_id: Optional[int] = None
     
-    @property
-    def event_type(self) -> str:
-        return "recording.started"
+    event_type: ClassVar[str] = "recording.started"
 
 
-@dataclass
+@event_dataclass
 class RecordingStoppedEvent(BaseEvent):
     """Event fired when audio recording stops"""
     duration_seconds: float = 0.0
     audio_size_bytes: int = 0
     
-    @property
-    def event_type(self) -> str:
-        return "recording.stopped"
+    event_type: ClassVar[str] = "recording.stopped"
 
 
-@dataclass
+@event_dataclass
 class AudioCapturedEvent(BaseEvent):
     """Event fired when audio data is captured"""
     audio_data: bytes = b""
     format: str = "wav"
     duration_seconds: float = 0.0
     
-    @property
-    def event_type(self) -> str:
-        return "audio.captured"
+    event_type: ClassVar[str] = "audio.captured"
 
 
-@dataclass
+@event_dataclass
 class TranscriptionRequestedEvent(BaseEvent):
     """Event fired when transcription is requested"""
     audio_size: int = 0
     model: str = "base"
     language: Optional[str] = None
     
-    @property
-    def event_type(self) -> str:
-        return "transcription.requested"
+    event_type: ClassVar[str] = "transcription.requested"
 
 
-@dataclass
+@event_dataclass
 class TranscriptionReceivedEvent(BaseEvent):
     """Event fired when transcription is received"""
     text: str = ""
@@ -115,36 +114,30 @@ class TranscriptionReceivedEvent(BaseEvent):
     processing_time: float = 0.0
     confidence: Optional[float] = None
     
-    @property
-    def event_type(self) -> str:
-        return "transcription.received"
+    event_type: ClassVar[str] = "transcription.received"
 
 
-@dataclass
+@event_dataclass
 class TextInjectedEvent(BaseEvent):
     """Event fired when text is injected into active window"""
     text: str = ""
     target_window: Optional[str] = None
     injection_method: str = "keyboard"
     
-    @property
-    def event_type(self) -> str:
-        return "text.injected"
+    event_type: ClassVar[str] = "text.injected"
 
 
-@dataclass
+@event_dataclass
 class ConnectionStatusEvent(BaseEvent):
     """Event fired when server connection status changes"""
     status: str = "disconnected"  # "connected", "disconnected", "connecting", "error"
     server_url: str = ""
     error_message: Optional[str] = None
     
-    @property
-    def event_type(self) -> str:
-        return "connection.status"
+    event_type: ClassVar[str] = "connection.status"
 
 
-@dataclass
+@event_dataclass
 class ErrorEvent(BaseEvent):
     """Event fired when an error occurs"""
     error_type: str = "unknown"
@@ -152,16 +145,15 @@ class ErrorEvent(BaseEvent):
     component: str = "system"
     stack_trace: Optional[str] = None
     
-    @property
-    def event_type(self) -> str:
-        return "system.error"
+    event_type: ClassVar[str] = "system.error"
     
     def __post_init__(self):
         self.priority = EventPriority.HIGH
 
 
 # Event handler types
-EventHandler = Callable[[BaseEvent], Result[None, Exception]]
+# Sync handlers may return None instead of Success(None)
+EventHandler = Callable[[BaseEvent], Optional[Result[None, Exception]]]
 AsyncEventHandler = Callable[[BaseEvent], asyncio.Future[Result[None, Exception]]]
 
 
@@ -261,6 +253,10 @@ class EventBus:
             logger.error(f"Failed to publish event {event.event_type}: {e}")
             return Failure(e)
     
+    def publish_nowait(self, event: BaseEvent) -> asyncio.Task:
+        """Schedule publishing on the running loop without awaiting it"""
+        return asyncio.create_task(self.publish(event))
+    
     def publish_sync(self, event: BaseEvent) -> Result[None, Exception]:
         """Publish event synchronously (for compatibility)"""
         try:
@@ -301,7 +297,7 @@ class EventBus:
             for handler in self._handlers[event_type]:
                 try:
                     result = handler(event)
-                    if result.is_failure():
+                    if result is not None and result.is_failure():
                         logger.error(f"Handler failed for {event_type}: {result.error}")
                 except Exception as e:
                     logger.error(f"Handler exception for {event_type}: {e}")